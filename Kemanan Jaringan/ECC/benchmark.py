@@ -0,0 +1,144 @@
+import os
+import time
+import secrets
+import statistics
+import fixed_base
+from ecc_service import ECCService
+from elliptic_curve import MUL_MODES, Point, G_Point, G_TABLE, n, encrypt, decrypt, encrypt_batch, decrypt_batch, message
+
+"""
+Benchmark throughput ECC (operasi per detik)
+- keygen  : G_Point * private_key
+- encrypt : dua perkalian skalar (C1 dan shared secret)
+- decrypt : satu perkalian skalar dan satu mod_inverse
+Dibandingkan antara perkalian affine lama (Point.mul_affine), perkalian Jacobian (wNAF) tanpa tabel G_Point,
+dan perkalian Jacobian dengan tabel fixed-base untuk G_Point
+Batch API (encrypt_batch/decrypt_batch) dibandingkan dengan encrypt/decrypt per pesan
+ECCService: pesan/detik terhadap jumlah worker process
+Mode perkalian skalar (ladder, double_and_add, wnaf, fixed_base): throughput dan variansi waktu
+terhadap skalar dengan Hamming weight rendah, tinggi, dan acak
+"""
+
+DURATION = 1.0
+BATCH_SIZE = 256
+SERVICE_MESSAGES = 4096
+MODE_SAMPLES = 200
+
+
+def throughput(func):
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION:
+        func()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def run_benchmark():
+    private_key = secrets.randbelow(n - 1) + 1
+    public_key = G_Point * private_key
+    C1, C2 = encrypt(message, public_key)
+    return {
+        "keygen": throughput(lambda: G_Point * (secrets.randbelow(n - 1) + 1)),
+        "encrypt": throughput(lambda: encrypt(message, public_key)),
+        "decrypt": throughput(lambda: decrypt(C1, C2, private_key)),
+    }
+
+
+def run_batch_benchmark():
+    private_key = secrets.randbelow(n - 1) + 1
+    public_key = G_Point * private_key
+    messages = [secrets.randbelow(2**128) for _ in range(BATCH_SIZE)]
+    pairs = encrypt_batch(messages, public_key)
+    return {
+        "encrypt": throughput(lambda: [encrypt(m, public_key) for m in messages]) * BATCH_SIZE,
+        "encrypt_batch": throughput(lambda: encrypt_batch(messages, public_key)) * BATCH_SIZE,
+        "decrypt": throughput(lambda: [decrypt(C1, C2, private_key) for C1, C2 in pairs]) * BATCH_SIZE,
+        "decrypt_batch": throughput(lambda: decrypt_batch(pairs, private_key)) * BATCH_SIZE,
+    }
+
+
+def scalar_classes():
+    #Hamming weight rendah / tinggi memperlihatkan perbedaan waktu yang bergantung pada pola bit skalar
+    return {
+        "low": [(1 << 255) | (1 << secrets.randbelow(255)) for _ in range(MODE_SAMPLES)],
+        "high": [((1 << 256) - 1 - (1 << secrets.randbelow(255))) % n for _ in range(MODE_SAMPLES)],
+        "random": [secrets.randbelow(n - 1) + 1 for _ in range(MODE_SAMPLES)],
+    }
+
+
+def run_mode_benchmark():
+    public_key = G_Point * (secrets.randbelow(n - 1) + 1)
+    scalars = scalar_classes()
+    results = {}
+    for mode in MUL_MODES[1:]:
+        point = G_Point if mode == "fixed_base" else public_key
+        point.mul_jacobian(1, mode) #pemanasan tabel
+        timings = {}
+        for name, ks in scalars.items():
+            timings[name] = []
+            for k in ks:
+                start = time.perf_counter_ns()
+                point.mul_jacobian(k, mode)
+                timings[name].append(time.perf_counter_ns() - start)
+        all_timings = [t for values in timings.values() for t in values]
+        results[mode] = {
+            "ops": 1e9 / statistics.mean(timings["random"]),
+            "cv": statistics.stdev(all_timings) / statistics.mean(all_timings),
+            "high_low": statistics.median(timings["high"]) / statistics.median(timings["low"]),
+        }
+    return results
+
+
+def run_service_benchmark():
+    private_key = secrets.randbelow(n - 1) + 1
+    public_key = G_Point * private_key
+    messages = [secrets.randbelow(2**128) for _ in range(SERVICE_MESSAGES)]
+    workers = 1
+    results = []
+    while True:
+        with ECCService(workers) as service:
+            service.generate_keys(workers) #pemanasan: worker dibuat dan tabel G_Point dimuat
+            start = time.perf_counter()
+            pairs = service.encrypt_batch(messages, public_key)
+            encrypt_rate = SERVICE_MESSAGES / (time.perf_counter() - start)
+            start = time.perf_counter()
+            service.decrypt_batch(pairs, private_key)
+            decrypt_rate = SERVICE_MESSAGES / (time.perf_counter() - start)
+        results.append((workers, encrypt_rate, decrypt_rate))
+        if workers >= (os.cpu_count() or 1):
+            return results
+        workers = min(workers * 2, os.cpu_count() or 1)
+
+
+if __name__ == "__main__":
+    G_TABLE.get_table()
+
+    jacobian_mul = Point.__mul__
+    Point.__mul__ = Point.mul_affine
+    affine = run_benchmark()
+    Point.__mul__ = jacobian_mul
+
+    del fixed_base.TABLES[(G_TABLE.x, G_TABLE.y, G_TABLE.p)]
+    jacobian = run_benchmark()
+    fixed_base.register(G_TABLE)
+    table = run_benchmark()
+
+    print(f"{'Operasi':<10} {'Affine (/s)':>12} {'Jacobian (/s)':>14} {'Fixed-base (/s)':>16} {'Speedup':>8}")
+    for op in affine:
+        print(f"{op:<10} {affine[op]:>12.1f} {jacobian[op]:>14.1f} {table[op]:>16.1f} {table[op] / affine[op]:>7.1f}x")
+
+    batch = run_batch_benchmark()
+    print(f"\nBatch {BATCH_SIZE} pesan (pesan/detik)")
+    for op in ("encrypt", "decrypt"):
+        print(f"{op:<10} per pesan: {batch[op]:>8.1f}   batch: {batch[op + '_batch']:>8.1f}   {batch[op + '_batch'] / batch[op]:.2f}x")
+
+    print(f"\nECCService {SERVICE_MESSAGES} pesan")
+    print(f"{'Worker':>6} {'encrypt (/s)':>13} {'decrypt (/s)':>13}")
+    for workers, encrypt_rate, decrypt_rate in run_service_benchmark():
+        print(f"{workers:>6} {encrypt_rate:>13.1f} {decrypt_rate:>13.1f}")
+
+    print(f"\nMode perkalian skalar ({MODE_SAMPLES} skalar per kelas)")
+    print(f"{'Mode':<15} {'ops/detik':>10} {'CV waktu':>9} {'high/low':>9}")
+    for mode, result in run_mode_benchmark().items():
+        print(f"{mode:<15} {result['ops']:>10.1f} {result['cv']:>9.3f} {result['high_low']:>9.2f}")
@@ -0,0 +1,62 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from elliptic_curve import G_Point, G_TABLE, n, encrypt_batch, decrypt_batch
+import secrets
+
+#process-pool service around key generation, encrypt and decrypt
+#pure Python ECC is CPU-bound, so batches are sharded across worker processes to scale with cores
+#each worker builds or loads its G_Point fixed-base table once, when the worker starts
+
+
+def _warm_worker():
+    G_TABLE.get_table()
+
+
+def _generate_keys(count):
+    keys = []
+    for _ in range(count):
+        private_key = secrets.randbelow(n - 1) + 1
+        keys.append((private_key, G_Point * private_key))
+    return keys
+
+
+def _encrypt_chunk(messages, public_key):
+    return encrypt_batch(messages, public_key)
+
+
+def _decrypt_chunk(pairs, private_key):
+    return decrypt_batch(pairs, private_key)
+
+
+class ECCService:
+    def __init__(self, workers=None, chunks_per_worker=2):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+        #the table is loaded here first so that forked workers inherit it and a missing cache file is written only once
+        G_TABLE.get_table()
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_worker)
+
+    def _shards(self, items):
+        size = max(1, -(-len(items) // (self.workers * self.chunks_per_worker)))
+        return [items[i:i + size] for i in range(0, len(items), size)]
+
+    def generate_keys(self, count):
+        sizes = [len(shard) for shard in self._shards(range(count))]
+        return [key for keys in self.pool.map(_generate_keys, sizes) for key in keys]
+
+    def encrypt_batch(self, messages, public_key):
+        shards = self._shards(list(messages))
+        return [pair for pairs in self.pool.map(_encrypt_chunk, shards, [public_key] * len(shards)) for pair in pairs]
+
+    def decrypt_batch(self, pairs, private_key):
+        shards = self._shards(list(pairs))
+        return [message for messages in self.pool.map(_decrypt_chunk, shards, [private_key] * len(shards)) for message in messages]
+
+    def close(self):
+        self.pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
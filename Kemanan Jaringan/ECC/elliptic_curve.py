@@ -1,7 +1,14 @@
-from mod_inverse import mod_inverse
+from field import inverse, batch_inverse
+from jacobian import from_jacobian, from_jacobian_batch, jacobian_multiply, montgomery_ladder
+from wnaf import wnaf_multiply
+import fixed_base
 import secrets
+import os
 
 class Curve:
+    #curve constants shared by every point on the curve
+    __slots__ = ("a", "b", "p")
+
     def __init__(self, a, b, p):
         self.a = a
         self.b = b
@@ -9,13 +16,20 @@ class Curve:
 
 class Point:
     #y^2 = x^3 + ax + b 
-    def __init__(self, x, y, curve):
+    __slots__ = ("x", "y", "curve", "valid")
+
+    #points are validated once here; results of point arithmetic are on the curve by construction
+    #and are created with trusted = True to skip the check
+    def __init__(self, x, y, curve, trusted = False):
         self.x = x
         self.y = y
         self.curve = curve
+        self.valid = trusted or self.is_on_curve()
 
     def is_on_curve(self):
         # y^2 = x^3 + ax + b
+        if self.x is None or self.y is None:
+            return True
         lhs = (self.y**2) % self.curve.p
         rhs = (self.x**3 + self.curve.a * self.x + self.curve.b) % self.curve.p
         return lhs == rhs
@@ -26,12 +40,11 @@ class Point:
         return f"Point(x={hex(self.x)}, y={hex(self.y)})"
     
     def __add__(self, other):
-        #two points are inverse of each other
-        if not self.is_on_curve() or not other.is_on_curve():
-            raise TypeError ('The points are not not curve')
-        
         if not isinstance(self, Point) or not isinstance(other, Point):
             raise TypeError ('Expected objects of class Point')
+
+        if not self.valid or not other.valid:
+            raise TypeError ('The points are not not curve')
         
         #identity coordinate y
         if self.x == None:
@@ -39,22 +52,59 @@ class Point:
         if other.x == None:
             return self
 
+        #two points are inverse of each other
         if self.x == other.x and self.y  == -(other.y - self.curve.p):
-            return Point(x = None, y = None, curve = self.curve)
+            return Point(x = None, y = None, curve = self.curve, trusted = True)
     
         #two points are different
         if self.x != other.x:
-            m = (other.y - self.y) * mod_inverse(other.x - self.x, self.curve.p)
+            m = (other.y - self.y) * inverse(other.x - self.x, self.curve.p)
 
         #two points are the same or point doubling (derivative)
         if self.x == other.x and self.y == other.y:
-            m = (3*self.x**2 + self.curve.a) * mod_inverse(2*self.y, self.curve.p)
+            m = (3*self.x**2 + self.curve.a) * inverse(2*self.y, self.curve.p)
 
         x3 = (m**2 - self.x - other.x) % self.curve.p
         y3 = (-(m*(x3 - self.x) + self.y)) % self.curve.p
-        return Point(x = x3, y = y3, curve = self.curve)
+        return Point(x = x3, y = y3, curve = self.curve, trusted = True)
     
     def __mul__(self, other):
+        return self.multiply(other)
+
+    def multiply(self, other, mode = None):
+        #scalar multiplication in Jacobian coordinates, a single inversion converts the result back to affine
+        x, y = from_jacobian(self.mul_jacobian(other, mode), self.curve.p)
+        return Point(x = x, y = y, curve = self.curve, trusted = True)
+
+    def mul_jacobian(self, other, mode = None):
+        #multiplying a point that is not on the curve would leak the scalar (invalid-curve attack)
+        if not self.valid:
+            raise TypeError ('The point is not on curve')
+        mode = mode or MUL_MODE
+        if mode not in MUL_MODES:
+            raise ValueError (f'Unknown multiplication mode {mode!r}, expected one of {MUL_MODES}')
+
+        #auto: points with a registered fixed-base table (G_Point) use the precomputed table,
+        #other points (public keys, C1) use wNAF with cached odd multiples
+        if mode in ("auto", "fixed_base"):
+            table = fixed_base.lookup(self.x, self.y, self.curve.p)
+            if table is not None:
+                return table.multiply(other)
+            if mode == "fixed_base":
+                raise ValueError ('The point has no fixed-base table')
+            mode = "wnaf"
+
+        #the ladder works modulo n, every point on secp256k1 is in the group of order n (cofactor 1)
+        if mode == "ladder":
+            if self.x is None:
+                return (1, 1, 0)
+            return montgomery_ladder(self.x, self.y, other, self.curve.a, self.curve.p, n)
+        if mode == "double_and_add":
+            return jacobian_multiply(self.x, self.y, other, self.curve.a, self.curve.p)
+        return wnaf_multiply(self.x, self.y, other, self.curve.a, self.curve.p)
+
+    def mul_affine(self, other):
+        #original affine double-and-add, one mod_inverse per addition
         track = [(1, self)]
         while track[-1][0] + track[-1][0] < other:
             track.append ((track[-1][0] + track[-1][0], track[-1][1] + track[-1][1]))
@@ -78,7 +128,25 @@ G_Point = Point (
     curve = elliptic_curve
 )
 
-n = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFBAAEDCE6AF48A03BBFD25E8CD0364141
+#scalar multiplication mode used by Point * k
+#"ladder" runs the Montgomery ladder (uniform operation sequence) for every point, including G_Point
+MUL_MODES = ("auto", "ladder", "double_and_add", "wnaf", "fixed_base")
+MUL_MODE = "auto"
+
+#order of G_Point
+n = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+#precomputed table for G_Point * k, built once per process on first use and cached on disk
+G_TABLE = fixed_base.register(fixed_base.FixedBaseTable(
+    x = G_Point.x,
+    y = G_Point.y,
+    a = elliptic_curve.a,
+    b = elliptic_curve.b,
+    p = elliptic_curve.p,
+    order = n,
+    window = 8,
+    cache_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "g_table_w8.txt")
+))
 
 def encrypt (message, public_key):
     temp_random_key = secrets.randbelow(n - 1) + 1
@@ -89,9 +157,36 @@ def encrypt (message, public_key):
 
 def decrypt(C1, C2, private_key):
     shared_secret = C1 * private_key  # PrivateKey * C1
-    message = (C2 * mod_inverse(shared_secret.x, elliptic_curve.p)) % elliptic_curve.p  # C2 dibagi shared_secret
+    message = (C2 * inverse(shared_secret.x, elliptic_curve.p)) % elliptic_curve.p  # C2 dibagi shared_secret
     return message
 
+def encrypt_batch (messages, public_key):
+    #all C1 and shared secrets are converted to affine with one shared inversion
+    p = elliptic_curve.p
+    temp_random_keys = [secrets.randbelow(n - 1) + 1 for _ in messages]
+    jacobian_points = [G_Point.mul_jacobian(k) for k in temp_random_keys]
+    jacobian_points += [public_key.mul_jacobian(k) for k in temp_random_keys]
+    affine = from_jacobian_batch(jacobian_points, p)
+
+    count = len(messages)
+    result = []
+    for i, message in enumerate(messages):
+        C1 = Point(x = affine[i][0], y = affine[i][1], curve = elliptic_curve, trusted = True)
+        C2 = (message * affine[count + i][0]) % p
+        result.append((C1, C2))
+    return result
+
+def decrypt_batch (pairs, private_key):
+    #shared_secret.x = X / Z^2, so 1 / shared_secret.x = Z^2 / X
+    #only the X coordinates are inverted, in one shared Montgomery batch inversion
+    p = elliptic_curve.p
+    shared_secrets = [C1.mul_jacobian(private_key) for C1, _ in pairs]
+    x_inverses = batch_inverse([X for X, _, _ in shared_secrets], p)
+    return [
+        (C2 * Z * Z * x_inv) % p
+        for (_, C2), (_, _, Z), x_inv in zip(pairs, shared_secrets, x_inverses)
+    ]
+
 message = 123456789
 
 
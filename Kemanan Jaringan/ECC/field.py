@@ -0,0 +1,156 @@
+import time
+import random
+from mod_inverse import mod_inverse
+
+#field arithmetic backends for the prime field of elliptic_curve
+#modular inverse backends:
+#- pow     : built-in pow(a, -1, p)
+#- euclid  : pure-Python extended Euclid (mod_inverse.py)
+#- binary  : binary extended GCD, only shifts and subtractions
+#- fermat  : a^(p - 2) mod p, p must be prime
+#the fastest backend is measured once at import time and exposed as inverse()
+#every backend raises ZeroDivisionError for a = 0 (mod p), whichever one is selected
+#the reduction backends are only compared in the benchmark below, nothing selects them at import
+
+#secp256k1 prime: p = 2^256 - 2^32 - 977
+SECP256K1_P = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+SECP256K1_C = (1 << 256) - SECP256K1_P
+MASK_256 = (1 << 256) - 1
+
+
+def _check_nonzero(a, p):
+    if a % p == 0:
+        raise ZeroDivisionError('0 has no inverse modulo p')
+
+
+def inverse_pow(a, p):
+    _check_nonzero(a, p)
+    return pow(a, -1, p)
+
+
+def inverse_euclid(a, p):
+    _check_nonzero(a, p)
+    return mod_inverse(a, p)
+
+
+def inverse_binary(a, p):
+    #p must be odd
+    _check_nonzero(a, p)
+    u, v = a % p, p
+    x1, x2 = 1, 0
+    while u != 1 and v != 1:
+        while not u & 1:
+            u >>= 1
+            x1 = x1 >> 1 if not x1 & 1 else (x1 + p) >> 1
+        while not v & 1:
+            v >>= 1
+            x2 = x2 >> 1 if not x2 & 1 else (x2 + p) >> 1
+        if u >= v:
+            u -= v
+            x1 -= x2
+        else:
+            v -= u
+            x2 -= x1
+    return (x1 if u == 1 else x2) % p
+
+
+def inverse_fermat(a, p):
+    _check_nonzero(a, p)
+    return pow(a, p - 2, p)
+
+
+INVERSE_BACKENDS = {
+    "pow": inverse_pow,
+    "euclid": inverse_euclid,
+    "binary": inverse_binary,
+    "fermat": inverse_fermat,
+}
+
+
+def reduce_secp256k1(x):
+    #x mod p for 0 <= x < p^2, using 2^256 = 2^32 + 977 (mod p) instead of a division
+    x = (x >> 256) * SECP256K1_C + (x & MASK_256)
+    x = (x >> 256) * SECP256K1_C + (x & MASK_256)
+    return x - SECP256K1_P if x >= SECP256K1_P else x
+
+
+def reduce_generic(x):
+    return x % SECP256K1_P
+
+
+REDUCE_BACKENDS = {
+    "generic": reduce_generic,
+    "secp256k1": reduce_secp256k1,
+}
+
+
+def time_backend(func, values, p=None):
+    start = time.perf_counter()
+    if p is None:
+        for v in values:
+            func(v)
+    else:
+        for v in values:
+            func(v, p)
+    return (time.perf_counter() - start) / len(values)
+
+
+def select_fastest(backends, values, p=None, repeat=3):
+    #best of several runs, the first run also warms up every backend
+    timings = {name: min(time_backend(func, values, p) for _ in range(repeat)) for name, func in backends.items()}
+    return min(timings, key=timings.get), timings
+
+
+def batch_inverse(values, p):
+    #Montgomery batch inversion
+    #inverts every value with a single inverse() plus 3 multiplications per value
+    #a single zero would turn the whole product, and so every result, into 0
+    if any(v % p == 0 for v in values):
+        raise ZeroDivisionError('0 has no inverse modulo p')
+    prefix = []
+    acc = 1
+    for v in values:
+        prefix.append(acc)
+        acc = acc * v % p
+
+    acc_inv = inverse(acc, p)
+    inverses = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        inverses[i] = acc_inv * prefix[i] % p
+        acc_inv = acc_inv * values[i] % p
+    return inverses
+
+
+#auto-selection at import, on a small fixed sample so import stays fast
+_rng = random.Random(0)
+_samples = [_rng.randrange(1, SECP256K1_P) for _ in range(32)]
+INVERSE_BACKEND, _ = select_fastest(INVERSE_BACKENDS, _samples, SECP256K1_P)
+inverse = INVERSE_BACKENDS[INVERSE_BACKEND]
+
+
+if __name__ == "__main__":
+    rng = random.Random()
+    values = [rng.randrange(1, SECP256K1_P) for _ in range(2000)]
+    for a in values[:50]:
+        expected = pow(a, -1, SECP256K1_P)
+        assert all(func(a, SECP256K1_P) == expected for func in INVERSE_BACKENDS.values())
+    for func in INVERSE_BACKENDS.values():
+        try:
+            func(SECP256K1_P, SECP256K1_P)
+        except ZeroDivisionError:
+            pass
+        else:
+            raise AssertionError(f"{func.__name__} tidak menolak 0")
+        assert reduce_secp256k1(a * values[-1]) == a * values[-1] % SECP256K1_P
+
+    _, timings = select_fastest(INVERSE_BACKENDS, values, SECP256K1_P)
+    print("Modular inverse (mikrodetik per operasi)")
+    for name, seconds in sorted(timings.items(), key=lambda item: item[1]):
+        print(f"{name:<10} {seconds * 1e6:>8.2f}")
+
+    _, timings = select_fastest(REDUCE_BACKENDS, [a * b for a, b in zip(values, reversed(values))])
+    print("\nReduksi mod p hasil perkalian 512-bit (mikrodetik per operasi)")
+    for name, seconds in sorted(timings.items(), key=lambda item: item[1]):
+        print(f"{name:<10} {seconds * 1e6:>8.2f}")
+
+    print(f"\nBackend terpilih saat import: inverse={INVERSE_BACKEND}")
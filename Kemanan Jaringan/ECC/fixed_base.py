@@ -0,0 +1,98 @@
+import os
+from jacobian import IDENTITY, jacobian_add, jacobian_add_affine, jacobian_double, from_jacobian
+
+#fixed-base windowed table for a generator point
+#table[i][d - 1] = d * 2^(window * i) * G in affine coordinates
+#k * G is then the sum of one table entry per window: no doublings, one mixed addition per window
+#the table is built lazily on first use, or loaded from cache_path if it was built before
+
+TABLES = {}
+
+
+class FixedBaseTable:
+    def __init__(self, x, y, a, b, p, order, window=8, cache_path=None):
+        self.x, self.y = x, y
+        self.a, self.b, self.p = a, b, p
+        self.order = order
+        self.window = window
+        self.windows = -(-order.bit_length() // window)
+        self.cache_path = cache_path
+        self.table = None
+
+    def header(self):
+        return f"{self.window} {self.x:x} {self.y:x} {self.p:x} {self.order:x}"
+
+    def build(self):
+        size = 1 << self.window
+        table = []
+        base = (self.x, self.y, 1)
+        for _ in range(self.windows):
+            row = []
+            R = IDENTITY
+            for _ in range(size - 1):
+                R = jacobian_add(R, base, self.a, self.p)
+                row.append(from_jacobian(R, self.p))
+            table.append(row)
+            for _ in range(self.window):
+                base = jacobian_double(base, self.a, self.p)
+        return table
+
+    def load(self):
+        with open(self.cache_path) as f:
+            if f.readline().strip() != self.header():
+                return None
+            points = [tuple(int(v, 16) for v in line.split()) for line in f]
+        size = (1 << self.window) - 1
+        if len(points) != self.windows * size:
+            return None
+        #a corrupted cache file must not produce wrong multiplications
+        for x, y in points:
+            if (y * y - x * x * x - self.a * x - self.b) % self.p:
+                return None
+        return [points[i * size:(i + 1) * size] for i in range(self.windows)]
+
+    def save(self, table):
+        tmp_path = self.cache_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(self.header() + "\n")
+            for row in table:
+                f.writelines(f"{x:x} {y:x}\n" for x, y in row)
+        os.replace(tmp_path, self.cache_path)
+
+    def get_table(self):
+        if self.table is None:
+            table = None
+            if self.cache_path and os.path.exists(self.cache_path):
+                table = self.load()
+            if table is None:
+                table = self.build()
+                if self.cache_path:
+                    try:
+                        self.save(table)
+                    except OSError:
+                        pass
+            self.table = table
+        return self.table
+
+    def multiply(self, k):
+        #returns k * G in Jacobian coordinates
+        table = self.get_table()
+        k %= self.order
+        mask = (1 << self.window) - 1
+        R = IDENTITY
+        for row in table:
+            digit = k & mask
+            if digit:
+                x, y = row[digit - 1]
+                R = jacobian_add_affine(R, x, y, self.a, self.p)
+            k >>= self.window
+        return R
+
+
+def register(table):
+    TABLES[(table.x, table.y, table.p)] = table
+    return table
+
+
+def lookup(x, y, p):
+    return TABLES.get((x, y, p))
@@ -0,0 +1,134 @@
+#Jacobian coordinates: (X, Y, Z) represents the affine point (X/Z^2, Y/Z^3)
+#the identity point (point at infinity) has Z = 0
+#all arithmetic stays free of modular inversion, only from_jacobian needs one
+
+from field import inverse, batch_inverse
+
+IDENTITY = (1, 1, 0)
+
+
+def to_jacobian(x, y):
+    if x is None:
+        return IDENTITY
+    return (x, y, 1)
+
+
+def from_jacobian(P, p):
+    X, Y, Z = P
+    if Z == 0:
+        return None, None
+    z_inv = inverse(Z, p)
+    z_inv2 = z_inv * z_inv % p
+    return X * z_inv2 % p, Y * z_inv2 * z_inv % p
+
+
+def from_jacobian_batch(points, p):
+    #converts many points with a single shared inversion (Montgomery batch inversion)
+    finite = [i for i, P in enumerate(points) if P[2] != 0]
+    z_invs = batch_inverse([points[i][2] for i in finite], p)
+    result = [(None, None)] * len(points)
+    for i, z_inv in zip(finite, z_invs):
+        X, Y, _ = points[i]
+        z_inv2 = z_inv * z_inv % p
+        result[i] = (X * z_inv2 % p, Y * z_inv2 * z_inv % p)
+    return result
+
+
+def jacobian_double(P, a, p):
+    X, Y, Z = P
+    if Z == 0 or Y == 0:
+        return IDENTITY
+    YY = Y * Y % p
+    S = 4 * X * YY % p
+    M = 3 * X * X
+    if a:
+        M += a * pow(Z, 4, p)
+    M %= p
+    X3 = (M * M - 2 * S) % p
+    Y3 = (M * (S - X3) - 8 * YY * YY) % p
+    Z3 = 2 * Y * Z % p
+    return (X3, Y3, Z3)
+
+
+def jacobian_add(P, Q, a, p):
+    X1, Y1, Z1 = P
+    X2, Y2, Z2 = Q
+    if Z1 == 0:
+        return Q
+    if Z2 == 0:
+        return P
+    Z1Z1 = Z1 * Z1 % p
+    Z2Z2 = Z2 * Z2 % p
+    U1 = X1 * Z2Z2 % p
+    U2 = X2 * Z1Z1 % p
+    S1 = Y1 * Z2 * Z2Z2 % p
+    S2 = Y2 * Z1 * Z1Z1 % p
+    if U1 == U2:
+        #same x: either the same point (doubling) or inverse points (identity)
+        if S1 != S2:
+            return IDENTITY
+        return jacobian_double(P, a, p)
+    H = (U2 - U1) % p
+    R = (S2 - S1) % p
+    HH = H * H % p
+    HHH = H * HH % p
+    V = U1 * HH % p
+    X3 = (R * R - HHH - 2 * V) % p
+    Y3 = (R * (V - X3) - S1 * HHH) % p
+    Z3 = Z1 * Z2 * H % p
+    return (X3, Y3, Z3)
+
+
+def jacobian_add_affine(P, x2, y2, a, p):
+    #mixed addition, Q = (x2, y2, 1) is affine so Z2 terms disappear
+    X1, Y1, Z1 = P
+    if Z1 == 0:
+        return (x2, y2, 1)
+    Z1Z1 = Z1 * Z1 % p
+    U2 = x2 * Z1Z1 % p
+    S2 = y2 * Z1 * Z1Z1 % p
+    if X1 == U2:
+        if Y1 != S2:
+            return IDENTITY
+        return jacobian_double(P, a, p)
+    H = (U2 - X1) % p
+    R = (S2 - Y1) % p
+    HH = H * H % p
+    HHH = H * HH % p
+    V = X1 * HH % p
+    X3 = (R * R - HHH - 2 * V) % p
+    Y3 = (R * (V - X3) - Y1 * HHH) % p
+    Z3 = Z1 * H % p
+    return (X3, Y3, Z3)
+
+
+def jacobian_multiply(x, y, k, a, p):
+    #left-to-right double-and-add, the affine base point is added with mixed addition
+    if x is None or k == 0:
+        return IDENTITY
+    if k < 0:
+        y, k = -y % p, -k
+    R = IDENTITY
+    for bit in bin(k)[2:]:
+        R = jacobian_double(R, a, p)
+        if bit == "1":
+            R = jacobian_add_affine(R, x, y, a, p)
+    return R
+
+
+def montgomery_ladder(x, y, k, a, p, order):
+    #uniform operation sequence: exactly one addition and one doubling per bit
+    #k is replaced by k + order or k + 2 * order, which is the same point but always has
+    #order.bit_length() + 1 bits, so the number of steps does not depend on the scalar
+    #(Python integers are not constant-time, this only removes the scalar-dependent branching)
+    k %= order
+    k += order
+    if k.bit_length() <= order.bit_length():
+        k += order
+    P = to_jacobian(x, y)
+    R = [P, jacobian_double(P, a, p)]
+    for i in range(k.bit_length() - 2, -1, -1):
+        bit = (k >> i) & 1
+        R[1 - bit] = jacobian_add(R[0], R[1], a, p)
+        R[bit] = jacobian_double(R[bit], a, p)
+    return R[0]
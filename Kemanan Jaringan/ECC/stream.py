@@ -0,0 +1,148 @@
+import hmac
+import hashlib
+import secrets
+from elliptic_curve import Point, G_Point, elliptic_curve, n
+
+#streaming encryption of arbitrary byte payloads
+#one ECDH-style key agreement per stream: C1 = G * r, shared_secret = public_key * r
+#the data is XORed with a SHAKE-256 keystream derived from shared_secret, chunk by chunk,
+#so a multi-MB payload costs two scalar multiplications plus linear symmetric work
+#keystream block i = SHAKE-256(key | i), so the output does not depend on how the data is chunked
+#stream format: C1.x (32 bytes) | C1.y (32 bytes) | ciphertext | HMAC-SHA256 tag (32 bytes)
+
+COORDINATE_SIZE = 32
+HEADER_SIZE = 2 * COORDINATE_SIZE
+TAG_SIZE = 32
+CHUNK_SIZE = 1 << 20
+KEYSTREAM_BLOCK = 1 << 16
+
+
+def _derive_keys(shared_secret):
+    secret = shared_secret.x.to_bytes(COORDINATE_SIZE, "big") + shared_secret.y.to_bytes(COORDINATE_SIZE, "big")
+    encryption_key = hashlib.sha256(b"ecc-stream-encryption" + secret).digest()
+    mac_key = hashlib.sha256(b"ecc-stream-mac" + secret).digest()
+    return encryption_key, mac_key
+
+
+class _Keystream:
+    #the last derived block is kept, so chunks smaller than KEYSTREAM_BLOCK do not re-derive it
+    def __init__(self, encryption_key):
+        self.encryption_key = encryption_key
+        self.index = None
+        self.block = b""
+
+    def _block(self, index):
+        if index != self.index:
+            self.block = hashlib.shake_256(self.encryption_key + index.to_bytes(8, "big")).digest(KEYSTREAM_BLOCK)
+            self.index = index
+        return self.block
+
+    def xor(self, chunk, offset):
+        first, last = offset // KEYSTREAM_BLOCK, (offset + len(chunk) - 1) // KEYSTREAM_BLOCK
+        keystream = b"".join(self._block(block) for block in range(first, last + 1))
+        start = offset - first * KEYSTREAM_BLOCK
+        keystream = keystream[start:start + len(chunk)]
+        return (int.from_bytes(chunk, "little") ^ int.from_bytes(keystream, "little")).to_bytes(len(chunk), "little")
+
+
+def _read_chunks(source, chunk_size):
+    #bytes-like objects are sliced, file-like objects are read chunk by chunk
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for i in range(0, len(view), chunk_size):
+            yield bytes(view[i:i + chunk_size])
+        return
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def encrypt_stream(source, public_key, chunk_size=CHUNK_SIZE):
+    temp_random_key = secrets.randbelow(n - 1) + 1
+    C1 = G_Point * temp_random_key
+    shared_secret = public_key * temp_random_key
+    encryption_key, mac_key = _derive_keys(shared_secret)
+    keystream = _Keystream(encryption_key)
+
+    header = C1.x.to_bytes(COORDINATE_SIZE, "big") + C1.y.to_bytes(COORDINATE_SIZE, "big")
+    mac = hmac.new(mac_key, header, hashlib.sha256)
+    yield header
+
+    offset = 0
+    for chunk in _read_chunks(source, chunk_size):
+        encrypted = keystream.xor(chunk, offset)
+        offset += len(chunk)
+        mac.update(encrypted)
+        yield encrypted
+    yield mac.digest()
+
+
+def decrypt_stream(source, private_key, chunk_size=CHUNK_SIZE):
+    #plaintext chunks are yielded before the tag is checked at the end of the stream;
+    #if ValueError is raised the caller must discard everything that was yielded
+    chunks = _read_chunks(source, chunk_size)
+    buffer = b""
+    for chunk in chunks:
+        buffer += chunk
+        if len(buffer) >= HEADER_SIZE:
+            break
+    if len(buffer) < HEADER_SIZE:
+        raise ValueError("Ciphertext stream is too short")
+    header, buffer = buffer[:HEADER_SIZE], buffer[HEADER_SIZE:]
+
+    C1 = Point(
+        x = int.from_bytes(header[:COORDINATE_SIZE], "big"),
+        y = int.from_bytes(header[COORDINATE_SIZE:], "big"),
+        curve = elliptic_curve
+    )
+    if not C1.valid:
+        raise ValueError("C1 is not on the curve")
+    encryption_key, mac_key = _derive_keys(C1 * private_key)
+    keystream = _Keystream(encryption_key)
+    mac = hmac.new(mac_key, header, hashlib.sha256)
+
+    #the last TAG_SIZE bytes are always held back because they may be the tag
+    offset = 0
+    for chunk in chunks:
+        buffer += chunk
+        while len(buffer) - TAG_SIZE >= chunk_size:
+            encrypted, buffer = buffer[:chunk_size], buffer[chunk_size:]
+            mac.update(encrypted)
+            yield keystream.xor(encrypted, offset)
+            offset += len(encrypted)
+
+    if len(buffer) < TAG_SIZE:
+        raise ValueError("Ciphertext stream is too short")
+    body, tag = buffer[:-TAG_SIZE], buffer[-TAG_SIZE:]
+    for i in range(0, len(body), chunk_size):
+        encrypted = body[i:i + chunk_size]
+        mac.update(encrypted)
+        yield keystream.xor(encrypted, offset)
+        offset += len(encrypted)
+
+    if not hmac.compare_digest(mac.digest(), tag):
+        raise ValueError("Authentication tag mismatch")
+
+
+if __name__ == "__main__":
+    import io
+    import time
+
+    private_key = secrets.randbelow(n - 1) + 1
+    public_key = G_Point * private_key
+    payload = secrets.token_bytes(16 * 1024 * 1024)
+
+    start = time.perf_counter()
+    ciphertext = b"".join(encrypt_stream(io.BytesIO(payload), public_key))
+    encrypt_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    plaintext = b"".join(decrypt_stream(io.BytesIO(ciphertext), private_key))
+    decrypt_time = time.perf_counter() - start
+
+    size = len(payload) / (1024 * 1024)
+    print(f"Payload: {size:.0f} MB, cocok: {plaintext == payload}")
+    print(f"Encrypt: {encrypt_time:.3f} s ({size / encrypt_time:.1f} MB/s)")
+    print(f"Decrypt: {decrypt_time:.3f} s ({size / decrypt_time:.1f} MB/s)")
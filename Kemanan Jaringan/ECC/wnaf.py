@@ -0,0 +1,61 @@
+from functools import lru_cache
+from jacobian import IDENTITY, jacobian_add_affine, jacobian_double, from_jacobian
+
+#width-w NAF variable-base multiplication
+#every non-zero digit is odd and at most one in w consecutive digits is non-zero,
+#so k * P needs about bitlen / (w + 1) additions instead of bitlen / 2
+#the odd multiples P, 3P, ..., (2^(w-1) - 1)P are cached per point, so repeated
+#multiplications with the same public key skip the precomputation
+
+WINDOW = 5
+CACHE_SIZE = 128
+
+
+def wnaf(k, w):
+    #digits from least to most significant
+    digits = []
+    half = 1 << (w - 1)
+    full = 1 << w
+    while k:
+        if k & 1:
+            digit = k & (full - 1)
+            if digit >= half:
+                digit -= full
+            k -= digit
+        else:
+            digit = 0
+        digits.append(digit)
+        k >>= 1
+    return digits
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def odd_multiples(x, y, a, p, w):
+    #affine P, 3P, 5P, ..., (2^(w-1) - 1)P
+    P = (x, y, 1)
+    twice = from_jacobian(jacobian_double(P, a, p), p)
+    multiples = [(x, y)]
+    R = P
+    for _ in range((1 << (w - 2)) - 1):
+        R = jacobian_add_affine(R, twice[0], twice[1], a, p)
+        multiples.append(from_jacobian(R, p))
+    return tuple(multiples)
+
+
+def wnaf_multiply(x, y, k, a, p, w=WINDOW):
+    #returns k * P in Jacobian coordinates
+    if x is None or k == 0:
+        return IDENTITY
+    if k < 0:
+        y, k = -y % p, -k
+    multiples = odd_multiples(x, y, a, p, w)
+    R = IDENTITY
+    for digit in reversed(wnaf(k, w)):
+        R = jacobian_double(R, a, p)
+        if digit > 0:
+            mx, my = multiples[digit >> 1]
+            R = jacobian_add_affine(R, mx, my, a, p)
+        elif digit < 0:
+            mx, my = multiples[(-digit) >> 1]
+            R = jacobian_add_affine(R, mx, -my % p, a, p)
+    return R
@@ -1,47 +1,123 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
 import matplotlib.pyplot as plt
 from gwo import gwo_optimize
 from objective import shifted_sphere_function, rosenbrock_function, shifted_sphere_boundaries, rosenbrock_boundaries
 
+OBJECTIVES = {
+    "Shifted Sphere": (shifted_sphere_function, shifted_sphere_boundaries()),
+    "Rosenbrock": (rosenbrock_function, rosenbrock_boundaries()),
+}
+MAX_CACHED_RUNS = 32
+
+
+class GWORun:
+    """Satu optimasi GWO yang berjalan di background, fitness_history diperbarui setiap iterasi"""
+    def __init__(self, objective, wolf_population, max_iteration, solution_dimention, seed):
+        self.params = (objective, wolf_population, max_iteration, solution_dimention, seed)
+        self.fitness_history = []
+        self.best_fit = None
+        self.error = None
+        self.done = False
+
+    def run(self):
+        objective, wolf_population, max_iteration, solution_dimention, seed = self.params
+        fitness_func, (lb, ub) = OBJECTIVES[objective]
+        try:
+            _, self.best_fit, self.fitness_history = gwo_optimize(
+                fitness_func, wolf_population, max_iteration, solution_dimention, lb, ub,
+                seed=seed, callback=self.update
+            )
+        except Exception as e:
+            self.error = e
+        self.done = True
+
+    def update(self, t, state):
+        #referensi ke list yang ditambah oleh gwo_optimize, tanpa salinan per iterasi;
+        #pembaca mengambil snapshot sendiri dengan list(...)
+        if self.fitness_history is not state["fitness_history"]:
+            self.fitness_history = state["fitness_history"]
+
+
+@st.cache_resource
+def run_registry():
+    #dipakai bersama oleh semua sesi: parameter yang sama dilayani dari cache, tidak dihitung ulang
+    return {"runs": OrderedDict(), "lock": threading.Lock(), "executor": ThreadPoolExecutor(max_workers=2)}
+
+
+def get_run(objective, wolf_population, max_iteration, solution_dimention, seed):
+    registry = run_registry()
+    key = (objective, wolf_population, max_iteration, solution_dimention, seed)
+    with registry["lock"]:
+        if key in registry["runs"] and registry["runs"][key].error is None:
+            registry["runs"].move_to_end(key)
+            return registry["runs"][key]
+        run = registry["runs"][key] = GWORun(*key)
+        registry["executor"].submit(run.run)
+
+        #membuang hasil lama yang sudah selesai jika cache penuh
+        finished = [k for k, r in registry["runs"].items() if r.done]
+        while len(registry["runs"]) > MAX_CACHED_RUNS and finished:
+            del registry["runs"][finished.pop(0)]
+        return run
+
+
 st.title("🐺Grey Wolf Optimization - Two Objective Comparison")
 
 wolf_population = st.number_input("Jumlah Serigala", min_value=5, value=5)
 max_iteration = st.number_input("Jumlah Iterasi", min_value=10, value=10)
 solution_dimention = st.number_input("Dimensi Solusi", min_value=1, value=1)
+seed = st.number_input("Seed", min_value=0, value=42)
 
 objective_options = ["Rosenbrock", "Shifted Sphere", "Keduanya"]
 selected_objective = st.selectbox("Pilih Fungsi Objektif yang ingin dijalankan", objective_options)
 
-shifted_sphere_lb, shifted_sphere_ub = shifted_sphere_boundaries()
-rosenbrock_lb, rosenbrock_ub = rosenbrock_boundaries()
-
 if st.button("Jalankan Optimasi"):
-    if selected_objective in ["Shifted Sphere", "Keduanya"]:
-        st.subheader("1. Shifted Sphere Function")
-        best_pos1, best_fit1, history1 = gwo_optimize(shifted_sphere_function, wolf_population, max_iteration, solution_dimention, shifted_sphere_lb, shifted_sphere_ub)
-        st.write(f"Nilai terbaik: {best_fit1:.4f}")
-        with st.container(height=300):
-            st.markdown("Fitness tiap iterasi:")
-            st.code("\n".join(f"Iterasi {i+1}: {val:.6f}" for i, val in enumerate(history1)), language="text")
+    objectives = ["Shifted Sphere", "Rosenbrock"] if selected_objective == "Keduanya" else [selected_objective]
+    st.session_state["active_runs"] = [
+        get_run(objective, int(wolf_population), int(max_iteration), int(solution_dimention), int(seed))
+        for objective in objectives
+    ]
+
 
-    if selected_objective in ["Rosenbrock", "Keduanya"]:
-        st.subheader("2. Rosenbrock Function")
-        best_pos2, best_fit2, history2 = gwo_optimize(rosenbrock_function, wolf_population, max_iteration, solution_dimention, rosenbrock_lb, rosenbrock_ub)
-        st.write(f"Nilai terbaik: {best_fit2:.4f}")
+def show_runs():
+    runs = st.session_state.get("active_runs", [])
+    if not runs:
+        return
+
+    for i, run in enumerate(runs, start=1):
+        objective = run.params[0]
+        history = list(run.fitness_history)
+        st.subheader(f"{i}. {objective} Function")
+        if run.error is not None:
+            st.error(f"Optimasi gagal: {run.error}")
+            continue
+        if run.done:
+            st.write(f"Nilai terbaik: {run.best_fit:.4f}")
+        else:
+            st.progress(len(history) / run.params[2], text=f"Iterasi {len(history)}/{run.params[2]}")
         with st.container(height=300):
             st.markdown("Fitness tiap iterasi:")
-            st.code("\n".join(f"Iterasi {i+1}: {val:.6f}" for i, val in enumerate(history2)), language="text")
+            st.code("\n".join(f"Iterasi {i+1}: {val:.6f}" for i, val in enumerate(history)), language="text")
 
     fig, ax = plt.subplots()
-    if selected_objective in ["Shifted Sphere", "Keduanya"]:
-        ax.plot(history1, label="shifted Sphere")
-    if selected_objective in ["Rosenbrock", "Keduanya"]:
-        ax.plot(history2, label="Rosenbrock")
+    for run in runs:
+        ax.plot(list(run.fitness_history), label=run.params[0])
 
     ax.set_xlabel("Iterasi")
     ax.set_ylabel("Fitness")
     ax.set_title("Konvergensi GWO")
     ax.legend()
     st.pyplot(fig)
+    plt.close(fig)
+
+    #semua optimasi selesai: rerun penuh agar refresh otomatis berhenti
+    if running and all(run.done for run in runs):
+        st.rerun()
 
 
+#selama masih ada optimasi yang berjalan, hanya bagian hasil yang di-refresh, input tetap bisa dipakai
+running = any(not run.done for run in st.session_state.get("active_runs", []))
+st.fragment(show_runs, run_every=0.5 if running else None)()
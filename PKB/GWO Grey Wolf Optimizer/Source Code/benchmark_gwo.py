@@ -0,0 +1,49 @@
+import time
+import numpy as np
+from gwo import gwo_optimize, gwo_optimize_scalar
+from objective import shifted_sphere_function, rosenbrock_function, shifted_sphere_boundaries, rosenbrock_boundaries
+
+"""
+Benchmark engine GWO vektor (gwo_optimize) terhadap engine skalar (gwo_optimize_scalar)
+- Waktu eksekusi untuk beberapa ukuran populasi dan dimensi
+- Rata-rata dan standar deviasi fitness akhir dari beberapa seed (hasil harus setara secara statistik)
+"""
+
+SIZES = [(30, 10), (100, 50), (500, 200)]
+MAX_ITERATION = 20
+RUNS = 5
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def benchmark_speed(fitness_func, lb, ub):
+    print(f"{'Serigala':>9} {'Dimensi':>8} {'Skalar (s)':>11} {'Vektor (s)':>11} {'Speedup':>8}")
+    for wolf_population, solution_dimention in SIZES:
+        np.random.seed(0)
+        scalar_time, _ = timed(gwo_optimize_scalar, fitness_func, wolf_population, MAX_ITERATION, solution_dimention, lb, ub)
+        vector_time, _ = timed(gwo_optimize, fitness_func, wolf_population, MAX_ITERATION, solution_dimention, lb, ub, seed=0)
+        print(f"{wolf_population:>9} {solution_dimention:>8} {scalar_time:>11.3f} {vector_time:>11.3f} {scalar_time / vector_time:>7.1f}x")
+
+
+def benchmark_quality(fitness_func, lb, ub, wolf_population=30, solution_dimention=10, max_iteration=100):
+    scalar_scores, vector_scores = [], []
+    for seed in range(RUNS):
+        np.random.seed(seed)
+        scalar_scores.append(gwo_optimize_scalar(fitness_func, wolf_population, max_iteration, solution_dimention, lb, ub)[1])
+        vector_scores.append(gwo_optimize(fitness_func, wolf_population, max_iteration, solution_dimention, lb, ub, seed=seed)[1])
+    print(f"Skalar: mean={np.mean(scalar_scores):.6g} std={np.std(scalar_scores):.6g}")
+    print(f"Vektor: mean={np.mean(vector_scores):.6g} std={np.std(vector_scores):.6g}")
+
+
+if __name__ == "__main__":
+    for name, fitness_func, (lb, ub) in [
+        ("Shifted Sphere", shifted_sphere_function, shifted_sphere_boundaries()),
+        ("Rosenbrock", rosenbrock_function, rosenbrock_boundaries()),
+    ]:
+        print(f"\n=== {name} ===")
+        benchmark_speed(fitness_func, lb, ub)
+        benchmark_quality(fitness_func, lb, ub)
@@ -0,0 +1,81 @@
+import os
+import json
+import threading
+import numpy as np
+
+"""
+Checkpoint/resume untuk optimizer
+- State optimizer (posisi, pemimpin/personal best, iterasi, state RNG, riwayat) disimpan dalam file .npz
+- Penulisan dilakukan di thread terpisah, loop iterasi hanya menyalin state (snapshot) lalu lanjut
+- Jika penulisan sebelumnya belum selesai, hanya snapshot terbaru yang ditulis
+- File ditulis ke file sementara lalu di-rename, sehingga checkpoint lama tidak rusak jika proses terhenti
+- Resume bit-exact selama cache fitness tidak dipakai (isi cache tidak ikut disimpan)
+"""
+
+
+def save_checkpoint(path, state):
+    arrays = {key: np.asarray(value) for key, value in state.items() if key != "rng_state"}
+    arrays["rng_state"] = np.array(json.dumps(state["rng_state"]))
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path):
+    with np.load(path) as data:
+        state = {key: data[key] for key in data.files}
+    state["rng_state"] = json.loads(str(state["rng_state"]))
+    return state
+
+
+class Checkpointer:
+    def __init__(self, path, every=10):
+        self.path = path
+        self.every = every
+        self.pending = None
+        self.writing = False
+        self.error = None
+        self.condition = threading.Condition()
+        self.thread = None
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def load(self):
+        return load_checkpoint(self.path)
+
+    def maybe_save(self, t, build_state):
+        if (t + 1) % self.every:
+            return
+        #snapshot disalin di loop utama agar iterasi berikutnya bebas mengubah array
+        snapshot = {key: value if key == "rng_state" else np.array(value, copy=True) for key, value in build_state().items()}
+        with self.condition:
+            self.pending = snapshot
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._writer, daemon=True)
+                self.thread.start()
+            self.condition.notify()
+
+    def _writer(self):
+        while True:
+            with self.condition:
+                while self.pending is None:
+                    self.condition.wait()
+                state, self.pending = self.pending, None
+                self.writing = True
+            try:
+                save_checkpoint(self.path, state)
+            except Exception as e:
+                self.error = e
+            with self.condition:
+                self.writing = False
+                self.condition.notify_all()
+
+    def flush(self):
+        with self.condition:
+            while self.pending is not None or self.writing:
+                self.condition.wait()
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
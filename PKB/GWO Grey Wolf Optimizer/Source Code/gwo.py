@@ -1,5 +1,119 @@
 import numpy as np
-def gwo_optimize(fitness_func, wolf_population, max_iteration, solution_dimention, lb, ub):
+from evaluation import Evaluator
+
+
+def gwo_optimize(fitness_func, wolf_population, max_iteration, solution_dimention, lb, ub, seed=None, evaluator=None, cache=None, stopping=None, callback=None, checkpoint=None, resume=False, return_info=False):
+    rng = np.random.default_rng(seed)
+    if evaluator is None:
+        evaluator = Evaluator()
+    info = {"eval_time": [], "utilization": [], "n_evaluations": 0, "stop_reason": "max_iteration"}
+    if stopping is not None:
+        stopping.start()
+
+    fitness_history = []
+    start_iteration = 0
+
+    #melanjutkan dari checkpoint terakhir, atau inisialisasi populasi baru
+    if resume and checkpoint is not None and checkpoint.exists():
+        state = checkpoint.load()
+        positions = state["positions"]
+        leader_positions = state["leader_positions"]
+        leader_scores = state["leader_scores"]
+        rng.bit_generator.state = state["rng_state"]
+        fitness_history = state["fitness_history"].tolist()
+        info["eval_time"] = state["eval_time"].tolist()
+        info["utilization"] = state["utilization"].tolist()
+        info["n_evaluations"] = int(state["n_evaluations"])
+        start_iteration = int(state["iteration"])
+    else:
+        #baris 0, 1, 2 adalah posisi Alpha, Beta, dan Delta
+        leader_positions = np.zeros((3, solution_dimention))
+        leader_scores = np.full(3, float("inf"))
+        positions = rng.uniform(lb, ub, (wolf_population, solution_dimention))
+
+    for t in range(start_iteration, max_iteration):
+
+        #pengecekan nilai fitness posisi setiap serigala terhadap fungsi objective
+        fitness = evaluator.evaluate(fitness_func, positions, info, cache)
+
+        #memilih alpha, beta, dan delta baru
+        _update_leaders(fitness, positions, leader_positions, leader_scores)
+
+        #variabel "a" dikurangi secara linear dari 2 hingga bernilai 0 seiring iterasi
+        a = 2 - t * (2 / max_iteration)
+
+        #satu kali randomisasi untuk seluruh populasi: r[0] = r1 dan r[1] = r2 untuk Alpha, Beta, Delta
+        r = rng.random((2, 3, wolf_population, solution_dimention))
+        A = 2 * a * r[0] - a
+        C = 2 * r[1]
+        leaders = leader_positions[:, np.newaxis, :]
+
+        #jarak setiap serigala ke Alpha, Beta, Delta dan posisi baru yang disarankan oleh masing-masing
+        D = np.abs(C * leaders - positions)
+        X = leaders - A * D
+
+        #posisi baru adalah rata-rata posisi yang disarankan oleh Alpha, Beta, Delta
+        positions = np.clip(X.mean(axis=0), lb, ub)
+
+        #mencatat nilai fitness terbaik setiap iterasi
+        fitness_history.append(leader_scores[0])
+
+        #callback boleh mengubah positions secara in-place, posisi baru dievaluasi pada iterasi berikutnya
+        if callback is not None:
+            callback(t, {
+                "positions": positions,
+                "fitness": fitness,
+                "leader_positions": leader_positions,
+                "leader_scores": leader_scores,
+                "fitness_history": fitness_history,
+            })
+
+        #menyimpan checkpoint secara asinkron setiap checkpoint.every iterasi
+        if checkpoint is not None:
+            checkpoint.maybe_save(t, lambda: {
+                "iteration": t + 1,
+                "positions": positions,
+                "leader_positions": leader_positions,
+                "leader_scores": leader_scores,
+                "rng_state": rng.bit_generator.state,
+                "fitness_history": fitness_history,
+                "eval_time": info["eval_time"],
+                "utilization": info["utilization"],
+                "n_evaluations": info["n_evaluations"],
+            })
+
+        #penghentian dini, alasan penghentian dicatat di info
+        if stopping is not None:
+            reason = stopping.check(fitness_history, info["n_evaluations"])
+            if reason is not None:
+                info["stop_reason"] = reason
+                break
+
+    if checkpoint is not None:
+        checkpoint.flush()
+    info["n_iterations"] = len(fitness_history)
+    if return_info:
+        return leader_positions[0].copy(), leader_scores[0], fitness_history, info
+    return leader_positions[0].copy(), leader_scores[0], fitness_history
+
+
+def _update_leaders(fitness, positions, leader_positions, leader_scores):
+    #serigala dengan fitness >= skor terburuk dari ketiga pemimpin tidak akan pernah terpilih,
+    #karena skor pemimpin hanya bisa turun selama pengecekan
+    candidates = np.flatnonzero(fitness < leader_scores.max())
+    for i in candidates:
+        if fitness[i] < leader_scores[0]:
+            leader_scores[0] = fitness[i]
+            leader_positions[0] = positions[i]
+        elif fitness[i] < leader_scores[1]:
+            leader_scores[1] = fitness[i]
+            leader_positions[1] = positions[i]
+        elif fitness[i] < leader_scores[2]:
+            leader_scores[2] = fitness[i]
+            leader_positions[2] = positions[i]
+
+
+def gwo_optimize_scalar(fitness_func, wolf_population, max_iteration, solution_dimention, lb, ub):
     alpha_positon = np.zeros(solution_dimention)
     alpha_score = float("inf")
     beta_positon = np.zeros(solution_dimention)
@@ -11,7 +125,7 @@ def gwo_optimize(fitness_func, wolf_population, max_iteration, solution_dimentio
     fitness_history = []
 
     for t in range(max_iteration):
-        
+
         #pengecekan nilai fitness posisi setiap serigala terhadap fungsi objective
         for i in range(wolf_population):
             fitness = fitness_func(positions[i])
@@ -26,7 +140,7 @@ def gwo_optimize(fitness_func, wolf_population, max_iteration, solution_dimentio
             elif fitness < delta_score:
                 delta_score = fitness
                 delta_positon = positions[i].copy()
-        
+
         #variabel "a" dikurangi secara linear dari 2 hingga bernilai 0 seiring iterasi
         a = 2 - t * (2 / max_iteration)
 
@@ -60,4 +174,4 @@ def gwo_optimize(fitness_func, wolf_population, max_iteration, solution_dimentio
         #mencatat nilai fitness terbaik setiap iterasi
         fitness_history.append(alpha_score)
 
-    return alpha_positon, alpha_score, fitness_history
\ No newline at end of file
+    return alpha_positon, alpha_score, fitness_history
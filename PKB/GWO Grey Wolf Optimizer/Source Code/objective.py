@@ -1,10 +1,15 @@
 import numpy as np
+from evaluation import batched
 
+#fungsi objective menerima satu posisi (d,) atau seluruh populasi (n, d)
+
+@batched
 def rosenbrock_function(x):
-    return np.sum(100.0 * (x[1:] - x[:-1]**2)**2 + (x[:-1] - 1)**2)
+    return np.sum(100.0 * (x[..., 1:] - x[..., :-1]**2)**2 + (x[..., :-1] - 1)**2, axis=-1)
 
+@batched
 def shifted_sphere_function(x):
-    return np.sum(np.square((x+0.5)))
+    return np.sum(np.square((x+0.5)), axis=-1)
 
 def rosenbrock_boundaries():
     lb = -30
@@ -14,4 +19,4 @@ def rosenbrock_boundaries():
 def shifted_sphere_boundaries():
     lb = -100
     ub = 100
-    return lb, ub
\ No newline at end of file
+    return lb, ub
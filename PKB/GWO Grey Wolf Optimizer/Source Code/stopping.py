@@ -0,0 +1,40 @@
+import time
+
+"""
+Kriteria penghentian dini untuk optimizer
+- stall_iterations : jumlah iterasi terakhir yang diamati (stall window)
+- rel_tol          : perbaikan relatif minimum dalam stall window, di bawah nilai ini optimasi berhenti
+- target_fitness   : berhenti jika fitness terbaik <= target
+- time_budget      : batas waktu (detik) sejak optimasi dimulai
+- eval_budget      : batas jumlah evaluasi fungsi objective (dicek di akhir setiap iterasi)
+Alasan penghentian: "stall", "tolerance", "target", "time", "evaluations"
+"""
+
+
+class StoppingCriteria:
+    def __init__(self, stall_iterations=None, rel_tol=0.0, target_fitness=None, time_budget=None, eval_budget=None):
+        self.stall_iterations = stall_iterations
+        self.rel_tol = rel_tol
+        self.target_fitness = target_fitness
+        self.time_budget = time_budget
+        self.eval_budget = eval_budget
+        self.start_time = None
+
+    def start(self):
+        self.start_time = time.perf_counter()
+
+    def check(self, fitness_history, n_evaluations):
+        best = fitness_history[-1]
+        if self.target_fitness is not None and best <= self.target_fitness:
+            return "target"
+        if self.eval_budget is not None and n_evaluations >= self.eval_budget:
+            return "evaluations"
+        if self.time_budget is not None and time.perf_counter() - self.start_time >= self.time_budget:
+            return "time"
+        if self.stall_iterations is not None and len(fitness_history) > self.stall_iterations:
+            previous = fitness_history[-1 - self.stall_iterations]
+            if best >= previous:
+                return "stall"
+            if previous - best <= self.rel_tol * max(abs(previous), 1e-300):
+                return "tolerance"
+        return None
@@ -0,0 +1,155 @@
+import time
+import multiprocessing as mp
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+from gwo import gwo_optimize
+from pso_formated import particle_swarm_optimizer
+
+"""
+Island model GWO/PSO
+- Setiap pulau adalah populasi independen (GWO atau PSO) yang berjalan di proses terpisah
+- Setiap migration_interval iterasi, setiap pulau menulis n_migrants agen terbaiknya ke shared memory
+  lalu menerima agen terbaik dari pulau tetangga (topologi ring) untuk menggantikan agen terburuknya
+  (untuk GWO "terburuk" diukur dari fitness iterasi sebelumnya, lihat _immigrate)
+- Riwayat global adalah nilai fitness terbaik dari seluruh pulau pada setiap iterasi
+"""
+
+OPTIMIZERS = {
+    "gwo": gwo_optimize,
+    "pso": particle_swarm_optimizer,
+}
+
+
+def _elites(state):
+    #GWO: Alpha, Beta, Delta | PSO: personal best setiap partikel
+    if "leader_positions" in state:
+        return state["leader_positions"], state["leader_scores"]
+    return state["best_positions"], state["best_scores"]
+
+
+def _immigrate(state, positions, scores):
+    if "leader_positions" in state:
+        #GWO (heuristik): callback dipanggil setelah update posisi, sehingga state["fitness"] adalah fitness
+        #posisi sebelumnya, bukan posisi serigala saat ini. Serigala yang tadinya terburuk yang diganti,
+        #belum tentu yang terburuk pada posisi barunya. Posisi imigran dievaluasi pada iterasi berikutnya
+        worst = np.argsort(state["fitness"])[::-1][:len(scores)]
+        state["positions"][worst] = positions
+    else:
+        #PSO: partikel dengan personal best terburuk diganti, kecepatannya direset
+        worst = np.argsort(state["best_scores"])[::-1][:len(scores)]
+        state["positions"][worst] = positions
+        state["best_positions"][worst] = positions
+        state["best_scores"][worst] = scores
+        state["fitness"][worst] = scores
+        state["velocities"][worst] = 0
+
+
+def _island_worker(index, algorithm, shm_name, shape, barrier, results, fitness_func, population, max_iteration, solution_dimension, lb, ub, migration_interval, seed):
+    shm = SharedMemory(name=shm_name)
+    board = np.ndarray(shape, dtype=float, buffer=shm.buf) #(n_islands, n_migrants, dimensi + 1), kolom terakhir adalah skor
+    n_islands, n_migrants = shape[0], shape[1]
+
+    def migrate(t, state):
+        if (t + 1) % migration_interval or t + 1 == max_iteration:
+            return
+        elite_positions, elite_scores = _elites(state)
+        best = np.argsort(elite_scores)[:n_migrants]
+        board[index, :, -1] = float("inf")
+        board[index, :len(best), :-1] = elite_positions[best]
+        board[index, :len(best), -1] = elite_scores[best]
+
+        #semua pulau menulis dulu, lalu semua pulau membaca, sebelum ada yang menulis lagi
+        barrier.wait()
+        incoming = board[(index - 1) % n_islands].copy()
+        barrier.wait()
+
+        incoming = incoming[np.isfinite(incoming[:, -1])]
+        if len(incoming):
+            _immigrate(state, incoming[:, :-1], incoming[:, -1])
+
+    try:
+        start = time.perf_counter()
+        best_position, best_score, history, info = OPTIMIZERS[algorithm](
+            fitness_func, population, max_iteration, solution_dimension, lb, ub,
+            seed=seed, callback=migrate, return_info=True
+        )
+        elapsed = time.perf_counter() - start
+        results.put((index, None, (best_position, best_score, history, info["n_evaluations"], elapsed)))
+    except BaseException as e:
+        #pulau lain tidak boleh menunggu selamanya di barrier
+        barrier.abort()
+        results.put((index, repr(e), None))
+    finally:
+        del board
+        shm.close()
+
+
+def island_optimize(islands, fitness_func, population, max_iteration, solution_dimension, lb, ub, migration_interval=10, n_migrants=2, seed=None, return_info=False):
+    """islands: daftar algoritma tiap pulau, misal ["gwo", "gwo", "pso", "pso"]"""
+    for algorithm in islands:
+        if algorithm not in OPTIMIZERS:
+            raise ValueError(f"algoritma pulau harus salah satu dari {tuple(OPTIMIZERS)}, bukan {algorithm!r}")
+
+    n_islands = len(islands)
+    shape = (n_islands, n_migrants, solution_dimension + 1)
+    seeds = np.random.SeedSequence(seed).spawn(n_islands)
+
+    shm = SharedMemory(create=True, size=int(np.prod(shape)) * np.dtype(float).itemsize)
+    barrier = mp.Barrier(n_islands)
+    results = mp.Queue()
+    processes = [
+        mp.Process(target=_island_worker, args=(
+            i, algorithm, shm.name, shape, barrier, results, fitness_func, population, max_iteration,
+            solution_dimension, lb, ub, migration_interval, seeds[i]
+        ))
+        for i, algorithm in enumerate(islands)
+    ]
+
+    try:
+        start = time.perf_counter()
+        for process in processes:
+            process.start()
+        collected = [results.get() for _ in processes]
+        elapsed = time.perf_counter() - start
+        for process in processes:
+            process.join()
+    finally:
+        shm.close()
+        shm.unlink()
+
+    errors = [f"pulau {index}: {error}" for index, error, _ in collected if error is not None]
+    if errors:
+        raise RuntimeError("island_optimize gagal, " + "; ".join(errors))
+
+    island_results = [result for _, _, result in sorted(collected, key=lambda item: item[0])]
+    best = min(range(n_islands), key=lambda i: island_results[i][1])
+    best_position, best_score = island_results[best][0], island_results[best][1]
+
+    #riwayat global: fitness terbaik dari seluruh pulau pada setiap iterasi
+    fitness_history = np.min([result[2] for result in island_results], axis=0).tolist()
+
+    if return_info:
+        n_evaluations = sum(result[3] for result in island_results)
+        info = {
+            "islands": [
+                {"algorithm": islands[i], "best_score": result[1], "fitness_history": result[2], "n_evaluations": result[3], "time": result[4]}
+                for i, result in enumerate(island_results)
+            ],
+            "n_evaluations": n_evaluations,
+            "time": elapsed,
+            "evaluations_per_second": n_evaluations / elapsed,
+        }
+        return best_position, best_score, fitness_history, info
+    return best_position, best_score, fitness_history
+
+
+if __name__ == "__main__":
+    from objective import rosenbrock_function, rosenbrock_boundaries
+
+    lb, ub = rosenbrock_boundaries()
+    for islands in (["gwo"], ["gwo", "pso"], ["gwo", "gwo", "pso", "pso"]):
+        best_pos, best_score, history, info = island_optimize(
+            islands, rosenbrock_function, population=200, max_iteration=200, solution_dimension=30,
+            lb=lb, ub=ub, migration_interval=20, seed=0, return_info=True
+        )
+        print(f"{len(islands)} pulau {islands}: best={best_score:.4f} evaluasi/detik={info['evaluations_per_second']:.0f}")
@@ -0,0 +1,22 @@
+import numpy as np
+from evaluation import batched
+
+#fungsi objective menerima satu posisi (d,) atau seluruh populasi (n, d)
+
+@batched
+def rosenbrock_function(x):
+    return np.sum(100.0 * (x[..., 1:] - x[..., :-1]**2)**2 + (x[..., :-1] - 1)**2, axis=-1)
+
+@batched
+def shifted_sphere_function(x):
+    return np.sum(np.square((x+0.5)), axis=-1)
+
+def rosenbrock_boundaries():
+    lb = -30
+    ub = 30
+    return lb, ub
+
+def shifted_sphere_boundaries():
+    lb = -100
+    ub = 100
+    return lb, ub
@@ -1,4 +1,5 @@
 import numpy as np
+from evaluation import Evaluator
 
 """
 Hyperparameter Setting
@@ -39,59 +40,119 @@ init_pos = np.array([
 
 
 
-class Particle:
-    def __init__(self, solution_dimension, init_pos):
-        self.position = init_pos
-        self.best_position = self.position
-        self.best_score = float("inf")
-        self.velocity =  np.zeros(solution_dimension)
-
-
-def particle_swarm_optimizer(fitness_func, particle_population, max_iteration, solution_dimension, lb, ub):
-    global_best_position = np.zeros(solution_dimension)
-    global_best_score = float("inf")
+def particle_swarm_optimizer(fitness_func, particle_population, max_iteration, solution_dimension, lb, ub, init_positions=None, seed=None, evaluator=None, cache=None, stopping=None, callback=None, checkpoint=None, resume=False, return_info=False):
+    rng = np.random.default_rng(seed)
+    if evaluator is None:
+        evaluator = Evaluator()
+    info = {"eval_time": [], "utilization": [], "n_evaluations": 0, "stop_reason": "max_iteration"}
+    if stopping is not None:
+        stopping.start()
 
     # v_max = 0.1 * np.abs(ub - lb)
     # v_min = -v_max
-    
-    particles = [Particle (solution_dimension, init_pos[i]) for i in range(particle_population)]
 
-    
     fitness_history = []
-
-    for i in range(particle_population):
-        particles[i].best_score = fitness = fitness_func(particles[i].position)
-        if fitness < global_best_score:
-            global_best_score = fitness
-            global_best_position = particles[i].position.copy()
-
-
-    for t in range(max_iteration):
+    start_iteration = 0
+
+    """Melanjutkan dari checkpoint terakhir, atau inisialisasi swarm baru"""
+    if resume and checkpoint is not None and checkpoint.exists():
+        state = checkpoint.load()
+        positions = state["positions"]
+        velocities = state["velocities"]
+        best_positions = state["best_positions"]
+        best_scores = state["best_scores"]
+        global_best_position = state["global_best_position"]
+        global_best_score = state["global_best_score"][()]
+        rng.bit_generator.state = state["rng_state"]
+        fitness_history = state["fitness_history"].tolist()
+        info["eval_time"] = state["eval_time"].tolist()
+        info["utilization"] = state["utilization"].tolist()
+        info["n_evaluations"] = int(state["n_evaluations"])
+        start_iteration = int(state["iteration"])
+    else:
+        """Swarm disimpan sebagai array (n, d) untuk posisi, kecepatan, dan personal best, serta skor personal best (n,)"""
+        if init_positions is None:
+            positions = rng.uniform(lb, ub, (particle_population, solution_dimension))
+        else:
+            positions = np.array(init_positions, dtype=float)
+            if positions.shape != (particle_population, solution_dimension):
+                raise ValueError(
+                    f"init_positions harus berukuran {(particle_population, solution_dimension)}, bukan {positions.shape}"
+                )
+        velocities = np.zeros((particle_population, solution_dimension))
+
+        #entri pertama info["eval_time"] dan info["utilization"] adalah evaluasi populasi awal
+        best_positions = positions.copy()
+        best_scores = evaluator.evaluate(fitness_func, positions, info, cache)
+        g = np.argmin(best_scores)
+        global_best_score = best_scores[g]
+        global_best_position = best_positions[g].copy()
+
+
+    for t in range(start_iteration, max_iteration):
         """Get new velocity and update the position"""
-        for i in range(particle_population):
-            for j in range (solution_dimension):
-                r1, r2 = np.random.rand(), np.random.rand()
-                #update velocity of j particle
-                particles[i].velocity[j] = (w * particles[i].velocity[j]) + (r1*c1*(particles[i].best_position[j] - particles[i].position[j])) + (r2*c2*(global_best_position[j] - particles[i].position[j]))
-
-                #update position of j solution of i particle
-                particles[i].position[j] += particles[i].velocity[j]
-            particles[i].position = np.clip(particles[i].position, lb, ub)
+        r = rng.random((2, particle_population, solution_dimension))
+        velocities = (w * velocities) + (r[0]*c1*(best_positions - positions)) + (r[1]*c2*(global_best_position - positions))
+        positions = np.clip(positions + velocities, lb, ub)
 
         """Calculate best position"""
-        for i in range(particle_population):
-            fitness = fitness_func(particles[i].position)
-            if fitness < particles[i].best_score:
-                particles[i].best_score = fitness
-                particles[i].best_position = particles[i].position.copy()
-            if fitness < global_best_score:
-                global_best_score = fitness
-                global_best_position = particles[i].position.copy()
+        fitness = evaluator.evaluate(fitness_func, positions, info, cache)
+        improved = fitness < best_scores
+        best_scores[improved] = fitness[improved]
+        best_positions[improved] = positions[improved]
+
+        g = np.argmin(best_scores)
+        if best_scores[g] < global_best_score:
+            global_best_score = best_scores[g]
+            global_best_position = best_positions[g].copy()
 
         fitness_history.append(global_best_score)
-    
-    return global_best_position, global_best_score, fitness_history
 
+        """Callback boleh mengubah array swarm secara in-place, global best disinkronkan ulang dari personal best"""
+        if callback is not None:
+            callback(t, {
+                "positions": positions,
+                "velocities": velocities,
+                "fitness": fitness,
+                "best_positions": best_positions,
+                "best_scores": best_scores,
+                "fitness_history": fitness_history,
+            })
+            g = np.argmin(best_scores)
+            if best_scores[g] < global_best_score:
+                global_best_score = best_scores[g]
+                global_best_position = best_positions[g].copy()
+
+        """Menyimpan checkpoint secara asinkron setiap checkpoint.every iterasi"""
+        if checkpoint is not None:
+            checkpoint.maybe_save(t, lambda: {
+                "iteration": t + 1,
+                "positions": positions,
+                "velocities": velocities,
+                "best_positions": best_positions,
+                "best_scores": best_scores,
+                "global_best_position": global_best_position,
+                "global_best_score": global_best_score,
+                "rng_state": rng.bit_generator.state,
+                "fitness_history": fitness_history,
+                "eval_time": info["eval_time"],
+                "utilization": info["utilization"],
+                "n_evaluations": info["n_evaluations"],
+            })
+
+        """Penghentian dini, alasan penghentian dicatat di info"""
+        if stopping is not None:
+            reason = stopping.check(fitness_history, info["n_evaluations"])
+            if reason is not None:
+                info["stop_reason"] = reason
+                break
+
+    if checkpoint is not None:
+        checkpoint.flush()
+    info["n_iterations"] = len(fitness_history)
+    if return_info:
+        return global_best_position, global_best_score, fitness_history, info
+    return global_best_position, global_best_score, fitness_history
 
         
 if __name__ == "__main__":
@@ -106,7 +167,8 @@ if __name__ == "__main__":
         max_iteration=5,
         solution_dimension=2,
         lb=-5.12,
-        ub=5.12
+        ub=5.12,
+        init_positions=init_pos
     )
     
     print(f"Best position: {best_pos}")
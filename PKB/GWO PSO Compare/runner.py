@@ -0,0 +1,234 @@
+import os
+import csv
+import glob
+import time
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from gwo import gwo_optimize
+from pso_formated import particle_swarm_optimizer
+from stopping import StoppingCriteria
+from objective import shifted_sphere_function, rosenbrock_function, shifted_sphere_boundaries, rosenbrock_boundaries
+
+"""
+Batch experiment runner GWO vs PSO
+- Sweep algoritma x objective x dimensi x populasi x seed dijalankan di process pool
+- Hasil akhir setiap konfigurasi ditulis ke results.csv, riwayat fitness ditulis ke shard .npz di folder curves/
+- Shard ditulis lebih dulu, baru baris CSV, sehingga konfigurasi yang ada di CSV pasti memiliki riwayat lengkap
+- Menjalankan ulang perintah yang sama hanya memproses konfigurasi yang belum ada di results.csv,
+  key konfigurasi memuat jumlah iterasi dan stall window sehingga budget yang berbeda tidak dianggap selesai
+- Konfigurasi yang gagal dicatat dengan stop_reason "error: ..." dan dijalankan ulang pada run berikutnya
+
+Contoh:
+    python runner.py run --algorithms gwo pso --objectives sphere rosenbrock --dims 10 30 --populations 20 50 --seeds 30
+    python runner.py aggregate
+"""
+
+ALGORITHMS = {
+    "gwo": gwo_optimize,
+    "pso": particle_swarm_optimizer,
+}
+
+OBJECTIVES = {
+    "sphere": (shifted_sphere_function, shifted_sphere_boundaries),
+    "rosenbrock": (rosenbrock_function, rosenbrock_boundaries),
+}
+
+FIELDS = ["key", "algorithm", "objective", "dimension", "population", "seed", "max_iteration", "stall", "iterations", "best_score", "n_evaluations", "time", "stop_reason"]
+
+
+def config_key(algorithm, objective, dimension, population, seed, max_iteration, stall_iterations):
+    return f"{algorithm}-{objective}-d{dimension}-n{population}-s{seed}-t{max_iteration}-stall{stall_iterations}"
+
+
+def config_row(algorithm, objective, dimension, population, seed, max_iteration, stall_iterations):
+    return {
+        "key": config_key(algorithm, objective, dimension, population, seed, max_iteration, stall_iterations),
+        "algorithm": algorithm,
+        "objective": objective,
+        "dimension": dimension,
+        "population": population,
+        "seed": seed,
+        "max_iteration": max_iteration,
+        "stall": stall_iterations,
+    }
+
+
+def run_config(algorithm, objective, dimension, population, seed, max_iteration, stall_iterations):
+    fitness_func, boundaries = OBJECTIVES[objective]
+    lb, ub = boundaries()
+    stopping = StoppingCriteria(stall_iterations=stall_iterations) if stall_iterations else None
+
+    start = time.perf_counter()
+    _, best_score, history, info = ALGORITHMS[algorithm](
+        fitness_func, population, max_iteration, dimension, lb, ub,
+        seed=seed, stopping=stopping, return_info=True
+    )
+    row = {
+        **config_row(algorithm, objective, dimension, population, seed, max_iteration, stall_iterations),
+        "iterations": info["n_iterations"],
+        "best_score": float(best_score),
+        "n_evaluations": info["n_evaluations"],
+        "time": time.perf_counter() - start,
+        "stop_reason": info["stop_reason"],
+    }
+    return row, np.asarray(history, dtype=float)
+
+
+def read_results(results_path):
+    if not os.path.exists(results_path):
+        return []
+    with open(results_path, newline="") as f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames != FIELDS:
+            raise SystemExit(f"{results_path} memakai format kolom lama/berbeda, gunakan --out yang baru")
+        return list(reader)
+
+
+def is_error(row):
+    return row["stop_reason"].startswith("error")
+
+
+def completed_keys(results_path):
+    #konfigurasi yang gagal tidak dianggap selesai sehingga dijalankan ulang
+    return {row["key"] for row in read_results(results_path) if not is_error(row)}
+
+
+def flush(out_dir, rows, curves):
+    if not rows:
+        return
+    curves_dir = os.path.join(out_dir, "curves")
+    os.makedirs(curves_dir, exist_ok=True)
+
+    #shard baru selalu memakai nomor berikutnya, ditulis atomik lewat file sementara
+    shard = len(glob.glob(os.path.join(curves_dir, "shard_*.npz")))
+    shard_path = os.path.join(curves_dir, f"shard_{shard:05d}.npz")
+    with open(shard_path + ".tmp", "wb") as f:
+        np.savez(f, **curves)
+    os.replace(shard_path + ".tmp", shard_path)
+
+    results_path = os.path.join(out_dir, "results.csv")
+    new_file = not os.path.exists(results_path)
+    with open(results_path, "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        if new_file:
+            writer.writeheader()
+        writer.writerows(rows)
+    rows.clear()
+    curves.clear()
+
+
+def run(args):
+    os.makedirs(args.out, exist_ok=True)
+    done = completed_keys(os.path.join(args.out, "results.csv"))
+    configs = [
+        config + (args.iterations, args.stall)
+        for config in itertools.product(args.algorithms, args.objectives, args.dims, args.populations, range(args.seeds))
+        if config_key(*config, args.iterations, args.stall) not in done
+    ]
+    print(f"{len(done)} konfigurasi sudah selesai, {len(configs)} konfigurasi akan dijalankan")
+
+    rows, curves = [], {}
+    executor = ProcessPoolExecutor(max_workers=args.workers)
+    try:
+        futures = {executor.submit(run_config, *config): config for config in configs}
+        for i, future in enumerate(as_completed(futures), start=1):
+            try:
+                row, history = future.result()
+            except Exception as e:
+                #kegagalan satu konfigurasi dicatat, sweep tetap berjalan
+                row = {**config_row(*futures[future]), "stop_reason": f"error: {e!r}"}
+                rows.append(row)
+                print(f"[{i}/{len(configs)}] {row['key']}: gagal ({e!r})")
+            else:
+                rows.append(row)
+                curves[row["key"]] = history
+                print(f"[{i}/{len(configs)}] {row['key']}: best={row['best_score']:.6g} ({row['time']:.2f} s)")
+            if len(rows) >= args.shard_size:
+                flush(args.out, rows, curves)
+    finally:
+        #jika terhenti (Ctrl-C), konfigurasi yang belum dimulai dibatalkan dan hasil yang sudah ada tetap ditulis
+        executor.shutdown(wait=True, cancel_futures=True)
+        flush(args.out, rows, curves)
+
+
+def load_curves(out_dir):
+    curves = {}
+    for shard_path in sorted(glob.glob(os.path.join(out_dir, "curves", "shard_*.npz"))):
+        with np.load(shard_path) as shard:
+            curves.update({key: shard[key] for key in shard.files})
+    return curves
+
+
+def aggregate(args):
+    rows = [row for row in read_results(os.path.join(args.out, "results.csv")) if not is_error(row)]
+    curves = load_curves(args.out)
+
+    #budget iterasi dan stall window yang berbeda tidak digabung dalam satu kurva
+    groups = {}
+    for row in rows:
+        group = f"{row['algorithm']}-{row['objective']}-d{row['dimension']}-n{row['population']}-t{row['max_iteration']}-stall{row['stall'] or None}"
+        groups.setdefault(group, []).append(curves[row["key"]])
+
+    summary = {}
+    for group, histories in sorted(groups.items()):
+        #riwayat yang berhenti lebih awal diperpanjang dengan nilai terakhirnya (best-so-far)
+        length = max(len(history) for history in histories)
+        padded = np.array([np.pad(history, (0, length - len(history)), mode="edge") for history in histories])
+        summary[f"{group}/mean"] = padded.mean(axis=0)
+        summary[f"{group}/median"] = np.median(padded, axis=0)
+        summary[f"{group}/min"] = padded.min(axis=0)
+        summary[f"{group}/max"] = padded.max(axis=0)
+        print(f"{group}: {len(histories)} seed, median akhir={summary[f'{group}/median'][-1]:.6g}, mean akhir={summary[f'{group}/mean'][-1]:.6g}")
+    np.savez(os.path.join(args.out, "convergence.npz"), **summary)
+
+    if args.plot:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        objectives = sorted({row["objective"] for row in rows})
+        fig, axes = plt.subplots(1, len(objectives), figsize=(7 * len(objectives), 5), squeeze=False)
+        for ax, objective in zip(axes[0], objectives):
+            for group in sorted(groups):
+                if f"-{objective}-" in group:
+                    ax.plot(summary[f"{group}/median"], label=group)
+            ax.set_yscale("log")
+            ax.set_xlabel("Iterasi")
+            ax.set_ylabel("Fitness (median)")
+            ax.set_title(f"Konvergensi GWO vs PSO - {objective}")
+            ax.legend(fontsize="small")
+        fig.tight_layout()
+        fig.savefig(os.path.join(args.out, "convergence.png"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch experiment runner GWO vs PSO")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="menjalankan sweep konfigurasi")
+    run_parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS), default=list(ALGORITHMS))
+    run_parser.add_argument("--objectives", nargs="+", choices=list(OBJECTIVES), default=list(OBJECTIVES))
+    run_parser.add_argument("--dims", nargs="+", type=int, default=[10, 30])
+    run_parser.add_argument("--populations", nargs="+", type=int, default=[30])
+    run_parser.add_argument("--seeds", type=int, default=10, help="jumlah seed per konfigurasi")
+    run_parser.add_argument("--iterations", type=int, default=500)
+    run_parser.add_argument("--stall", type=int, default=None, help="stall window untuk penghentian dini")
+    run_parser.add_argument("--workers", type=int, default=None)
+    run_parser.add_argument("--shard-size", type=int, default=50, help="jumlah konfigurasi per shard .npz")
+    run_parser.add_argument("--out", default="experiments")
+
+    aggregate_parser = subparsers.add_parser("aggregate", help="membuat kurva konvergensi agregat")
+    aggregate_parser.add_argument("--out", default="experiments")
+    aggregate_parser.add_argument("--plot", action="store_true", help="menyimpan convergence.png")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args)
+    else:
+        aggregate(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import numpy as np
+
+"""
+Protokol evaluasi fitness
+- Fungsi objective biasa (legacy) menerima satu posisi (d,) dan mengembalikan satu nilai fitness
+- Fungsi objective batched menerima matriks populasi (n, d) dan mengembalikan vektor fitness (n,)
+- Fungsi batched ditandai dengan decorator @batched sehingga optimizer dapat mendeteksinya
+"""
+
+
+def batched(func):
+    func.batched = True
+    return func
+
+
+def is_batched(fitness_func):
+    return getattr(fitness_func, "batched", False)
+
+
+def evaluate_population(fitness_func, positions):
+    #fungsi batched dipanggil sekali untuk seluruh populasi
+    if is_batched(fitness_func):
+        return np.asarray(fitness_func(positions), dtype=float).reshape(len(positions))
+
+    #fallback untuk fungsi objective legacy: dipanggil sekali per agen
+    return np.array([fitness_func(x) for x in positions], dtype=float)
+
+
+"""
+Backend evaluasi populasi untuk fungsi objective yang mahal
+- serial  : dievaluasi di proses utama
+- thread  : ThreadPoolExecutor, cocok untuk fungsi objective yang melepas GIL (NumPy, I/O, simulasi eksternal)
+- process : ProcessPoolExecutor dengan pengiriman per chunk, fungsi objective harus bisa di-pickle (fungsi top-level)
+Urutan hasil selalu sama dengan urutan baris populasi, sehingga hasil optimasi tetap deterministik per seed
+"""
+
+BACKENDS = ("serial", "thread", "process")
+
+
+def _evaluate_chunk(fitness_func, chunk):
+    start = time.perf_counter()
+    fitness = evaluate_population(fitness_func, chunk)
+    return fitness, time.perf_counter() - start
+
+
+class Evaluator:
+    def __init__(self, backend="serial", max_workers=None, chunksize=None):
+        if backend not in BACKENDS:
+            raise ValueError(f"backend harus salah satu dari {BACKENDS}, bukan {backend!r}")
+        self.backend = backend
+        self.max_workers = 1 if backend == "serial" else (max_workers or os.cpu_count() or 1)
+        self.chunksize = chunksize
+        self.executor = None
+
+    def _get_executor(self):
+        if self.executor is None:
+            if self.backend == "thread":
+                self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            else:
+                self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self.executor
+
+    def _chunks(self, positions):
+        #default: 4 chunk per worker agar beban tetap seimbang walaupun waktu evaluasi tiap agen berbeda
+        chunksize = self.chunksize or max(1, -(-len(positions) // (self.max_workers * 4)))
+        return [positions[i:i + chunksize] for i in range(0, len(positions), chunksize)]
+
+    def _evaluate(self, fitness_func, positions):
+        if len(positions) == 0:
+            return np.empty(0), 0.0
+        if self.backend == "serial":
+            start = time.perf_counter()
+            fitness = evaluate_population(fitness_func, positions)
+            return fitness, time.perf_counter() - start
+        executor = self._get_executor()
+        futures = [executor.submit(_evaluate_chunk, fitness_func, chunk) for chunk in self._chunks(positions)]
+        results = [future.result() for future in futures]
+        return np.concatenate([values for values, _ in results]), sum(seconds for _, seconds in results)
+
+    def evaluate(self, fitness_func, positions, info=None, cache=None):
+        start = time.perf_counter()
+        if cache is None:
+            fitness, busy = self._evaluate(fitness_func, positions)
+            n_evaluations = len(positions)
+        else:
+            #hanya posisi yang belum ada di cache yang dievaluasi
+            fitness, missing, keys, duplicates = cache.lookup(positions)
+            values, busy = self._evaluate(fitness_func, positions[missing])
+            cache.store(keys, values)
+            fitness[missing] = values
+            for i, first in duplicates:
+                fitness[i] = fitness[first]
+            n_evaluations = len(missing)
+        elapsed = time.perf_counter() - start
+
+        #mencatat waktu evaluasi dan utilisasi worker (waktu sibuk worker / kapasitas worker selama evaluasi)
+        if info is not None:
+            info["eval_time"].append(elapsed)
+            info["utilization"].append(min(1.0, busy / (elapsed * self.max_workers)) if elapsed > 0 else 1.0)
+            info["n_evaluations"] += n_evaluations
+            if cache is not None:
+                info["cache"] = cache.stats()
+        return fitness
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+"""
+Cache fitness dengan key posisi yang dikuantisasi
+- Posisi dibulatkan ke kelipatan resolution, posisi yang jatuh pada sel yang sama dianggap identik
+- Eviction LRU dengan batas jumlah entri (max_entries) dan perkiraan memori (max_bytes)
+- Serigala/partikel yang terkumpul atau terpotong np.clip ke titik lb/ub yang sama tidak dievaluasi ulang
+"""
+
+ENTRY_OVERHEAD = 200 #perkiraan byte per entri OrderedDict di luar isi key
+
+
+class FitnessCache:
+    def __init__(self, resolution=1e-9, max_entries=100_000, max_bytes=64 * 1024 * 1024):
+        self.resolution = resolution
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def keys(self, positions):
+        #+ 0.0 menyamakan -0.0 dengan 0.0 agar key-nya identik
+        quantized = np.round(np.asarray(positions, dtype=float) / self.resolution) + 0.0
+        return [row.tobytes() for row in quantized]
+
+    def lookup(self, positions):
+        """Mengembalikan (fitness, indeks baris yang harus dievaluasi, key baris tersebut, pasangan (duplikat, baris asli))"""
+        keys = self.keys(positions)
+        fitness = np.empty(len(keys))
+        missing, missing_keys, duplicates, first_seen = [], [], [], {}
+        for i, key in enumerate(keys):
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+                fitness[i] = value
+                self.hits += 1
+            elif key in first_seen:
+                #posisi yang sama muncul lebih dari sekali dalam satu populasi
+                duplicates.append((i, first_seen[key]))
+                self.hits += 1
+            else:
+                first_seen[key] = i
+                missing.append(i)
+                missing_keys.append(key)
+                self.misses += 1
+        return fitness, np.array(missing, dtype=int), missing_keys, duplicates
+
+    def store(self, keys, values):
+        for key, value in zip(keys, values):
+            self.entries[key] = float(value)
+            self.nbytes += len(key) + ENTRY_OVERHEAD
+        while self.entries and (len(self.entries) > self.max_entries or self.nbytes > self.max_bytes):
+            key, _ = self.entries.popitem(last=False)
+            self.nbytes -= len(key) + ENTRY_OVERHEAD
+            self.evictions += 1
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "nbytes": self.nbytes,
+        }
@@ -0,0 +1,121 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# ==== CONV2D TERVEKTORISASI ====
+# X: [N, H, W] (batch matriks MFCC), filters: [F, fh, fw]
+# output: [N, F, H - fh + 1, W - fw + 1], urutan sama dengan np.stack hasil conv2d per filter,
+# sehingga reshape(N, -1) menghasilkan vektor flat yang sama dengan model yang sudah tersimpan
+def conv2d_batch(X, filters):
+    windows = sliding_window_view(X, filters.shape[1:], axis=(1, 2))  # [N, H', W', fh, fw]
+    return np.einsum('nijab,fab->nfij', windows, filters, optimize=True)
+
+
+# ==== FITUR CNN UNTUK SATU BATCH ====
+def conv_features(X_mfcc, filters):
+    conv = np.maximum(0, conv2d_batch(X_mfcc, filters))
+    return conv.reshape(len(X_mfcc), -1)
+
+
+# ==== GRADIEN FILTER ====
+# korelasi antara jendela input dan gradien peta konvolusi, dijumlahkan untuk seluruh batch
+# X: [N, H, W], d_conv: [N, F, H', W'] -> [F, fh, fw]
+def conv2d_filter_grad(X, d_conv, filter_shape):
+    windows = sliding_window_view(X, filter_shape, axis=(1, 2))  # [N, H', W', fh, fw]
+    return np.einsum('nijab,nfij->fab', windows, d_conv, optimize=True)
+
+
+# ==== FORWARD & BACKWARD MINI-BATCH ====
+# params: dict dengan kunci yang sama seperti pickle model (filters, W_mlp, b_mlp, W_out, b_out)
+def forward(params, X_mfcc, X_extra):
+    conv = conv2d_batch(X_mfcc, params['filters'])
+    flat = np.maximum(0, conv).reshape(len(X_mfcc), -1)
+    h_mlp = np.maximum(0, np.dot(X_extra, params['W_mlp']) + params['b_mlp'])
+    z_concat = np.concatenate([flat, h_mlp], axis=1)
+    z_out = np.dot(z_concat, params['W_out']) + params['b_out']
+    exp = np.exp(z_out - np.max(z_out, axis=1, keepdims=True))
+    y_pred = exp / np.sum(exp, axis=1, keepdims=True)
+    return y_pred, (X_mfcc, X_extra, conv, h_mlp, z_concat)
+
+
+def backward(params, y_pred, y_true, cache):
+    X_mfcc, X_extra, conv, h_mlp, z_concat = cache
+    n = len(y_true)
+    flat_len = z_concat.shape[1] - h_mlp.shape[1]
+
+    # gradien dirata-rata terhadap ukuran batch
+    dL = (y_pred - y_true) / n
+    grads = {
+        'W_out': np.dot(z_concat.T, dL),
+        'b_out': dL.sum(axis=0, keepdims=True),
+    }
+    dz_concat = np.dot(dL, params['W_out'].T)
+
+    dz_mlp = dz_concat[:, flat_len:] * (h_mlp > 0)
+    grads['W_mlp'] = np.dot(X_extra.T, dz_mlp)
+    grads['b_mlp'] = dz_mlp.sum(axis=0, keepdims=True)
+
+    # dz_flat tidak lagi dibuang: diteruskan lewat ReLU ke filter konvolusi
+    d_conv = dz_concat[:, :flat_len].reshape(conv.shape) * (conv > 0)
+    grads['filters'] = conv2d_filter_grad(X_mfcc, d_conv, params['filters'].shape[1:])
+    return grads
+
+
+# ==== OPTIMIZER ====
+class SGD:
+    def __init__(self, lr=0.01, momentum=0.9):
+        self.lr = lr
+        self.momentum = momentum
+        self.velocity = {}
+
+    def step(self, params, grads):
+        for key, grad in grads.items():
+            v = self.velocity.get(key, 0)
+            v = self.momentum * v - self.lr * grad
+            self.velocity[key] = v
+            params[key] += v
+
+
+class Adam:
+    def __init__(self, lr=0.001, beta1=0.9, beta2=0.999, eps=1e-8):
+        self.lr = lr
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.eps = eps
+        self.m, self.v = {}, {}
+        self.t = 0
+
+    def step(self, params, grads):
+        self.t += 1
+        for key, grad in grads.items():
+            m = self.m[key] = self.beta1 * self.m.get(key, 0) + (1 - self.beta1) * grad
+            v = self.v[key] = self.beta2 * self.v.get(key, 0) + (1 - self.beta2) * grad ** 2
+            m_hat = m / (1 - self.beta1 ** self.t)
+            v_hat = v / (1 - self.beta2 ** self.t)
+            params[key] -= self.lr * m_hat / (np.sqrt(v_hat) + self.eps)
+
+
+OPTIMIZERS = {'sgd': SGD, 'adam': Adam}
+
+
+# ==== TRAINING MINI-BATCH ====
+# menghasilkan (epoch, loss total, akurasi) setiap epoch, params diperbarui in-place
+def train(params, X_mfcc, X_extra, y_onehot, epochs, batch_size=32, optimizer='adam', lr=0.001, seed=42):
+    if optimizer not in OPTIMIZERS:
+        raise ValueError(f"optimizer harus salah satu dari {tuple(OPTIMIZERS)}, bukan {optimizer!r}")
+    opt = OPTIMIZERS[optimizer](lr=lr)
+    rng = np.random.default_rng(seed)
+    n = len(X_mfcc)
+
+    for epoch in range(epochs):
+        loss_total, correct = 0, 0
+        order = rng.permutation(n)
+        for start in range(0, n, batch_size):
+            idx = order[start:start + batch_size]
+            y_true = y_onehot[idx]
+            y_pred, cache = forward(params, X_mfcc[idx], X_extra[idx])
+
+            loss_total += -np.sum(y_true * np.log(y_pred + 1e-9))
+            correct += np.sum(np.argmax(y_pred, axis=1) == np.argmax(y_true, axis=1))
+
+            opt.step(params, backward(params, y_pred, y_true, cache))
+        yield epoch, loss_total, correct / n
@@ -0,0 +1,192 @@
+import os
+import json
+import time
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import librosa
+from spectral import batch_features
+
+"""
+Feature store MFCC + fitur spektral
+- Ekstraksi dijalankan paralel di process pool, hanya untuk file yang baru atau berubah
+- Hasil disimpan di cache_dir sebagai mfcc_<gen>.npy dan extra_<gen>.npy (dibaca dengan memory-map)
+  serta index.json yang memetakan path -> (ukuran, mtime, baris)
+- Array generasi baru ditulis lebih dulu, baru index.json diganti secara atomik,
+  sehingga cache tetap konsisten walaupun proses terhenti di tengah jalan
+- Perubahan parameter ekstraksi (sample rate, durasi, jumlah MFCC) atau FEATURE_VERSION membuat cache dibangun ulang
+- Fitur dihitung per batch file dengan satu STFT per klip (lihat spectral.py)
+
+Cache juga bisa dibangun terlebih dahulu dari command line:
+    python feature_store.py dataset_augmented
+"""
+
+CACHE_DIR = 'feature_cache'
+BATCH_SIZE = 32
+FEATURE_VERSION = 2  # 2: engine satu STFT (spectral.py)
+
+
+# ==== EKSTRAKSI FITUR ====
+def _load_clip(file_path, sample_rate, samples):
+    y, _ = librosa.load(file_path, sr=sample_rate)
+    return librosa.util.fix_length(data=y, size=samples)
+
+
+def extract_batch(file_paths, sample_rate=16000, samples=32000, n_mfcc=13):
+    # semua klip memiliki panjang yang sama, sehingga satu STFT dipakai untuk seluruh fitur seluruh batch
+    Y = np.stack([_load_clip(path, sample_rate, samples) for path in file_paths])
+    return batch_features(Y, sample_rate, n_mfcc)
+
+
+def extract_features(file_path, sample_rate=16000, samples=32000, n_mfcc=13):
+    mfcc, extra = extract_batch([file_path], sample_rate, samples, n_mfcc)
+    return mfcc[0], extra[0]  # mfcc: (time, n_mfcc), extra: rms, zcr, centroid, rolloff, bandwidth
+
+
+def _extract(args):
+    paths, config = args
+    return extract_batch(paths, **config)
+
+
+def _file_key(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _pool_context():
+    #script pemanggil (audio_barbie_puppy.py) tidak memiliki guard __main__, dengan start method spawn
+    #proses anak akan menjalankan ulang seluruh script. Pool hanya dipakai jika fork tersedia,
+    #di Windows ekstraksi berjalan serial (atau bangun cache lewat command line di atas)
+    if __name__ == '__main__':
+        return mp.get_context()
+    if 'fork' in mp.get_all_start_methods():
+        return mp.get_context('fork')
+    return None
+
+
+def _extract_all(paths, config, workers):
+    context = _pool_context()
+    if context is None or workers == 1 or len(paths) < 2:
+        workers = 1
+    workers = workers or os.cpu_count() or 1
+
+    #file dibagi menjadi batch, setiap batch diekstraksi dengan satu STFT bersama
+    batch_size = max(1, min(BATCH_SIZE, -(-len(paths) // workers)))
+    jobs = [(paths[i:i + batch_size], config) for i in range(0, len(paths), batch_size)]
+    if workers == 1:
+        results = [_extract(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            results = list(executor.map(_extract, jobs))
+    return np.concatenate([mfcc for mfcc, _ in results]), np.concatenate([extra for _, extra in results])
+
+
+def _load_index(cache_dir, config):
+    index_path = os.path.join(cache_dir, 'index.json')
+    generation = -1
+    if os.path.exists(index_path):
+        with open(index_path) as f:
+            index = json.load(f)
+        generation = index['generation']
+        if index['config'] == config and index.get('version') == FEATURE_VERSION:
+            mfcc = np.load(os.path.join(cache_dir, f'mfcc_{generation}.npy'), mmap_mode='r')
+            extra = np.load(os.path.join(cache_dir, f'extra_{generation}.npy'), mmap_mode='r')
+            return index, mfcc, extra
+    #cache kosong, nomor generasi tetap dilanjutkan agar file generasi lama ikut terhapus
+    return {'version': FEATURE_VERSION, 'config': config, 'generation': generation, 'files': {}}, None, None
+
+
+def _save_array(path, array):
+    with open(path + '.tmp', 'wb') as f:
+        np.save(f, array)
+    os.replace(path + '.tmp', path)
+
+
+def load_features(paths, cache_dir=CACHE_DIR, workers=None, **config):
+    """Mengembalikan (X_mfcc [N, time, n_mfcc], X_extra [N, 5]) dengan urutan yang sama seperti paths"""
+    start = time.perf_counter()
+    os.makedirs(cache_dir, exist_ok=True)
+    config = {'sample_rate': 16000, 'samples': 32000, 'n_mfcc': 13, **config}
+    index, mfcc_cache, extra_cache = _load_index(cache_dir, config)
+    files = index['files']
+
+    keys = {path: _file_key(path) for path in paths}
+    missing = [path for path in keys if files.get(path, {}).get('key') != keys[path]]
+
+    if missing:
+        print(f"🎧 Ekstraksi fitur {len(missing)} file baru/berubah ({len(keys) - len(missing)} file dari cache)...")
+        new_mfcc, new_extra = _extract_all(missing, config, workers)
+
+        #baris lama yang masih valid disalin ke generasi baru, file yang sudah dihapus dibuang
+        kept = [
+            path for path, entry in files.items()
+            if (path not in keys and os.path.exists(path)) or (path in keys and entry['key'] == keys[path])
+        ]
+        old_rows = [files[path]['row'] for path in kept]
+        if kept:
+            new_mfcc = np.concatenate([mfcc_cache[old_rows], new_mfcc])
+            new_extra = np.concatenate([extra_cache[old_rows], new_extra])
+
+        old_gen, gen = index['generation'], index['generation'] + 1
+        _save_array(os.path.join(cache_dir, f'mfcc_{gen}.npy'), new_mfcc)
+        _save_array(os.path.join(cache_dir, f'extra_{gen}.npy'), new_extra)
+
+        old_keys = {path: files[path]['key'] for path in kept}
+        index = {
+            'version': FEATURE_VERSION,
+            'config': config,
+            'generation': gen,
+            'files': {
+                **{path: {'key': old_keys[path], 'row': row} for row, path in enumerate(kept)},
+                **{path: {'key': keys[path], 'row': len(kept) + row} for row, path in enumerate(missing)},
+            },
+        }
+        index_path = os.path.join(cache_dir, 'index.json')
+        with open(index_path + '.tmp', 'w') as f:
+            json.dump(index, f)
+        os.replace(index_path + '.tmp', index_path)
+
+        #memory-map generasi lama harus ditutup sebelum filenya dihapus
+        del mfcc_cache, extra_cache
+        for name in (f'mfcc_{old_gen}.npy', f'extra_{old_gen}.npy'):
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
+        mfcc_cache = np.load(os.path.join(cache_dir, f'mfcc_{gen}.npy'), mmap_mode='r')
+        extra_cache = np.load(os.path.join(cache_dir, f'extra_{gen}.npy'), mmap_mode='r')
+
+    rows = [index['files'][path]['row'] for path in paths]
+    X_mfcc, X_extra = np.asarray(mfcc_cache[rows]), np.asarray(extra_cache[rows])
+    print(f"📂 Fitur {len(paths)} file siap ({time.perf_counter() - start:.2f} s)")
+    return X_mfcc, X_extra
+
+
+def list_wav_files(data_path):
+    """Mengembalikan (paths, labels) untuk setiap file .wav di data_path/<label>/"""
+    paths, labels = [], []
+    for label in os.listdir(data_path):
+        for fname in os.listdir(os.path.join(data_path, label)):
+            if fname.endswith('.wav'):
+                paths.append(os.path.join(data_path, label, fname))
+                labels.append(label)
+    return paths, labels
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Membangun cache fitur audio secara paralel")
+    parser.add_argument('data_path', nargs='?', default='dataset_augmented')
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--sample-rate', type=int, default=16000)
+    parser.add_argument('--duration', type=float, default=2.0)
+    parser.add_argument('--n-mfcc', type=int, default=13)
+    args = parser.parse_args()
+
+    paths, _ = list_wav_files(args.data_path)
+    load_features(
+        paths, cache_dir=args.cache_dir, workers=args.workers,
+        sample_rate=args.sample_rate, samples=int(args.sample_rate * args.duration), n_mfcc=args.n_mfcc
+    )
@@ -1,18 +1,43 @@
 import os
+import sys
+import json
+import zlib
+import queue
+import hashlib
+import threading
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 import librosa
 import soundfile as sf
 import numpy as np
 
+"""
+Pipeline preprocessing + augmentasi paralel
+- Setiap file diproses (preprocessing + 5 augmentasi) di process pool, jumlah file yang sedang diproses dibatasi
+- Hasil ditulis ke disk oleh thread writer terpisah lewat antrian berukuran terbatas, ditulis atomik (file .tmp lalu rename)
+- Manifest (preprocessing_manifest.json) mencatat ukuran, mtime, dan hash setiap file input yang sudah selesai,
+  file yang tidak berubah dan semua output-nya masih ada akan dilewati
+- Manifest disimpan berkala, sehingga pipeline yang terhenti bisa dijalankan ulang dan melanjutkan sisanya
+"""
+
 # === Folder input/output ===
 BASE_INPUT = 'dataset_original'
 BASE_PREPROCESSED = 'dataset_preprocessed'
 BASE_AUGMENTED = 'dataset_augmented'
+MANIFEST_PATH = 'preprocessing_manifest.json'
 
 # Parameter audio
 TARGET_SR = 16000
 TARGET_DURATION = 2.0  # seconds
 SAMPLES = int(TARGET_SR * TARGET_DURATION)
 
+# Parameter pipeline
+WORKERS = None  # None = semua core
+MAX_PENDING = 2  # jumlah file yang diproses/menunggu ditulis per worker
+MANIFEST_EVERY = 50  # manifest disimpan setiap N file selesai
+SUFFIXES = ['_noise', '_pitch', '_stretch', '_reverb', '_volume']
+# output lama menjadi tidak valid jika parameter berubah
+PARAMS = {'sr': TARGET_SR, 'samples': SAMPLES, 'suffixes': SUFFIXES}
+
 # === Fungsi untuk membuat folder ===
 def ensure_dir(path):
     if not os.path.exists(path):
@@ -53,8 +78,7 @@ def augment_audio(audio, sr):
     # 4. Reverb sederhana (echo dengan decay)
     decay = 0.6
     echo = np.copy(audio)
-    for i in range(sr, len(audio)):
-        echo[i] += decay * audio[i - sr]  # delay 1 detik
+    echo[sr:] += decay * audio[:len(audio) - sr]  # delay 1 detik
     echo = echo / np.max(np.abs(echo))  # re-normalisasi
     aug_list.append(echo)
     suffixes.append('_reverb')
@@ -67,32 +91,180 @@ def augment_audio(audio, sr):
 
     return aug_list, suffixes
 
-# === Proses semua file dalam setiap label ===
-for label in os.listdir(BASE_INPUT):
-    label_dir = os.path.join(BASE_INPUT, label)
-    if not os.path.isdir(label_dir):
-        continue  # skip file, only process folder
-
-    print(f"\n🔍 Memproses label: {label}")
-    out_pre = os.path.join(BASE_PREPROCESSED, label)
-    out_aug = os.path.join(BASE_AUGMENTED, label)
-    ensure_dir(out_pre)
-    ensure_dir(out_aug)
-
-    for fname in os.listdir(label_dir):
-        if not fname.endswith('.wav'):
-            continue
+# === Proses satu file (dijalankan di worker) ===
+def process_file(in_path):
+    #seed dari path agar noise sama setiap kali dijalankan ulang, tidak bergantung pada worker
+    np.random.seed(zlib.crc32(in_path.encode()))
+    audio = preprocess_audio(in_path)
+    augmented, suffixes = augment_audio(audio, TARGET_SR)
+    return audio, list(zip(suffixes, augmented))
+
+
+def output_paths(label, fname):
+    pre = os.path.join(BASE_PREPROCESSED, label, fname)
+    aug = [os.path.join(BASE_AUGMENTED, label, fname.replace('.wav', f'{suffix}.wav')) for suffix in SUFFIXES]
+    return pre, aug
+
+
+# === Manifest ===
+def file_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def file_stat(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def load_manifest():
+    if os.path.exists(MANIFEST_PATH):
+        with open(MANIFEST_PATH) as f:
+            manifest = json.load(f)
+        if manifest.get('params') == PARAMS:
+            return manifest
+    return {'params': PARAMS, 'files': {}}
+
+
+def save_manifest(manifest):
+    with open(MANIFEST_PATH + '.tmp', 'w') as f:
+        json.dump(manifest, f)
+    os.replace(MANIFEST_PATH + '.tmp', MANIFEST_PATH)
+
+
+def is_up_to_date(manifest, in_path, outputs):
+    entry = manifest['files'].get(in_path)
+    if entry is None or not all(os.path.exists(path) for path in outputs):
+        return False
+    stat = file_stat(in_path)
+    if entry['stat'] == stat:
+        return True
+    #mtime berubah (misal file disalin ulang) tetapi isinya sama: cukup perbarui manifest
+    if entry['hash'] == file_hash(in_path):
+        entry['stat'] = stat
+        return True
+    return False
 
-        in_path = os.path.join(label_dir, fname)
 
-        # === PREPROCESSING ===
-        audio = preprocess_audio(in_path)
-        sf.write(os.path.join(out_pre, fname), audio, TARGET_SR)
+def write_wav(path, audio):
+    sf.write(path + '.tmp', audio, TARGET_SR, format='WAV')
+    os.replace(path + '.tmp', path)
 
-        # === AUGMENTASI ===
-        augmented, suffixes = augment_audio(audio, TARGET_SR)
-        for aug_audio, suffix in zip(augmented, suffixes):
-            new_name = fname.replace('.wav', f'{suffix}.wav')
-            sf.write(os.path.join(out_aug, new_name), aug_audio, TARGET_SR)
 
+# === Writer asinkron ===
+def writer(write_queue, manifest, lock, errors):
+    done = 0
+    while True:
+        item = write_queue.get()
+        if item is None:
+            break
+        in_path, fname, pre_path, aug_paths, audio, augmented = item
+        try:
+            write_wav(pre_path, audio)
+            for path, (_, aug_audio) in zip(aug_paths, augmented):
+                write_wav(path, aug_audio)
+
+            #file dicatat di manifest hanya setelah semua output-nya tertulis
+            with lock:
+                manifest['files'][in_path] = {'stat': file_stat(in_path), 'hash': file_hash(in_path)}
+                done += 1
+                if done % MANIFEST_EVERY == 0:
+                    save_manifest(manifest)
+        except Exception as e:
+            #kegagalan menulis dilaporkan ke thread utama, writer berhenti
+            errors.append((fname, e))
+            return
         print(f"✔ {fname} selesai diproses.")
+
+
+def put_item(write_queue, item, writer_thread):
+    #put dengan timeout agar thread utama tidak menunggu selamanya jika writer sudah berhenti
+    while writer_thread.is_alive():
+        try:
+            write_queue.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+# === Proses semua file dalam setiap label ===
+def run_pipeline(workers=WORKERS):
+    """Mengembalikan jumlah file yang gagal diproses, RuntimeError jika ada output yang gagal ditulis"""
+    ensure_dir(BASE_AUGMENTED)
+    manifest = load_manifest()
+
+    jobs, skipped = [], 0
+    for label in os.listdir(BASE_INPUT):
+        label_dir = os.path.join(BASE_INPUT, label)
+        if not os.path.isdir(label_dir):
+            continue  # skip file, only process folder
+
+        ensure_dir(os.path.join(BASE_PREPROCESSED, label))
+        ensure_dir(os.path.join(BASE_AUGMENTED, label))
+        for fname in os.listdir(label_dir):
+            if not fname.endswith('.wav'):
+                continue
+            in_path = os.path.join(label_dir, fname)
+            pre_path, aug_paths = output_paths(label, fname)
+            if is_up_to_date(manifest, in_path, [pre_path] + aug_paths):
+                skipped += 1
+            else:
+                jobs.append((in_path, fname, pre_path, aug_paths))
+
+    print(f"🔍 {len(jobs)} file akan diproses, {skipped} file sudah up to date dan dilewati")
+    if not jobs:
+        save_manifest(manifest)
+        return 0
+
+    workers = workers or os.cpu_count() or 1
+    lock = threading.Lock()
+    errors, failed = [], []
+    write_queue = queue.Queue(maxsize=workers * MAX_PENDING)
+    writer_thread = threading.Thread(target=writer, args=(write_queue, manifest, lock, errors))
+    writer_thread.start()
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = {}
+        jobs = iter(jobs)
+        while not errors:
+            #jumlah file yang sedang diproses dibatasi agar memori tidak membengkak
+            for job in jobs:
+                pending[executor.submit(process_file, job[0])] = job
+                if len(pending) >= workers * MAX_PENDING:
+                    break
+            if not pending:
+                break
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                in_path, fname, pre_path, aug_paths = pending.pop(future)
+                try:
+                    audio, augmented = future.result()
+                except Exception as e:
+                    #satu file rusak tidak menghentikan seluruh pipeline, file ini dicoba lagi pada run berikutnya
+                    failed.append(fname)
+                    print(f"✘ {fname} gagal diproses: {e!r}")
+                    continue
+                if not put_item(write_queue, (in_path, fname, pre_path, aug_paths, audio, augmented), writer_thread):
+                    break
+    finally:
+        #pekerjaan yang belum dimulai dibatalkan jika pipeline berhenti lebih awal
+        executor.shutdown(wait=True, cancel_futures=True)
+
+        #file yang sudah selesai tetap tertulis dan tercatat walaupun pipeline terhenti
+        put_item(write_queue, None, writer_thread)
+        writer_thread.join()
+        with lock:
+            save_manifest(manifest)
+
+    if errors:
+        fname, e = errors[0]
+        raise RuntimeError(f"gagal menulis output {fname}: {e!r}")
+    if failed:
+        print(f"⚠ {len(failed)} file gagal diproses dan akan dicoba lagi pada run berikutnya")
+    return len(failed)
+
+
+if __name__ == '__main__':
+    sys.exit(1 if run_pipeline() else 0)
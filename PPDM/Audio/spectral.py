@@ -0,0 +1,65 @@
+import numpy as np
+import scipy.fft
+import scipy.signal
+import librosa
+
+"""
+Engine fitur spektral dengan satu STFT per klip
+- Semua klip memiliki panjang yang sama (fix_length), sehingga satu batch bisa di-frame dan di-FFT sekaligus
+- Frame sinyal dipakai bersama untuk STFT, RMS, dan ZCR
+- Magnitudo STFT dipakai bersama untuk MFCC (via mel power spectrogram), centroid, rolloff, dan bandwidth
+- Parameter mengikuti default librosa >= 0.10 (n_fft=2048, hop=512, center=True, pad_mode='constant',
+  128 mel band, top_db=80), sehingga hasilnya setara dengan pemanggilan librosa.feature.* satu per satu
+"""
+
+N_FFT = 2048
+HOP_LENGTH = 512
+N_MELS = 128
+TOP_DB = 80.0
+ROLL_PERCENT = 0.85
+
+
+def _frames(Y, pad_mode):
+    # Y: [N, samples] -> [N, n_frames, N_FFT], padding di kedua sisi seperti center=True
+    padded = np.pad(Y, ((0, 0), (N_FFT // 2, N_FFT // 2)), mode=pad_mode)
+    return np.lib.stride_tricks.sliding_window_view(padded, N_FFT, axis=1)[:, ::HOP_LENGTH]
+
+
+def _normalize_l1(S):
+    # normalisasi L1 per frame, frame tanpa energi tetap bernilai 0 (seperti librosa.util.normalize)
+    norm = S.sum(axis=-1, keepdims=True)
+    return S / np.where(norm < np.finfo(S.dtype).tiny, 1, norm)
+
+
+def batch_features(Y, sr, n_mfcc=13):
+    """Y: [N, samples] -> (mfcc [N, time, n_mfcc], extra [N, 5] = rms, zcr, centroid, rolloff, bandwidth)"""
+    Y = np.atleast_2d(Y)
+    frames = _frames(Y, 'constant')  # [N, T, N_FFT]
+
+    # satu STFT untuk seluruh batch
+    window = scipy.signal.get_window('hann', N_FFT, fftbins=True).astype(Y.dtype)
+    S = np.abs(scipy.fft.rfft(frames * window, axis=-1))  # [N, T, 1 + N_FFT // 2]
+    freqs = np.fft.rfftfreq(N_FFT, 1 / sr)
+
+    # MFCC: mel power spectrogram -> dB (top_db per klip) -> DCT
+    mel = np.dot(S ** 2, librosa.filters.mel(sr=sr, n_fft=N_FFT, n_mels=N_MELS).T)  # [N, T, N_MELS]
+    log_mel = 10 * np.log10(np.maximum(1e-10, mel))
+    log_mel = np.maximum(log_mel, log_mel.max(axis=(1, 2), keepdims=True) - TOP_DB)
+    mfcc = scipy.fft.dct(log_mel, axis=-1, type=2, norm='ortho')[..., :n_mfcc]  # [N, T, n_mfcc]
+
+    # domain waktu: frame yang sama dengan STFT
+    rms = np.sqrt(np.mean(frames ** 2, axis=-1))
+    edge_frames = _frames(Y, 'edge')
+    signs = np.signbit(np.where(np.abs(edge_frames) <= 1e-10, 0, edge_frames))
+    zcr = np.sum(signs[..., 1:] != signs[..., :-1], axis=-1) / N_FFT
+
+    # domain frekuensi: magnitudo STFT yang sama
+    weights = _normalize_l1(S)
+    centroid = np.sum(weights * freqs, axis=-1)
+    bandwidth = np.sqrt(np.sum(weights * (freqs - centroid[..., np.newaxis]) ** 2, axis=-1))
+    cumulative = np.cumsum(S, axis=-1)
+    reached = cumulative >= ROLL_PERCENT * cumulative[..., -1:]
+    rolloff = freqs[np.argmax(reached, axis=-1)]
+
+    extra = np.stack([f.mean(axis=1) for f in (rms, zcr, centroid, rolloff, bandwidth)], axis=1)
+    return mfcc, extra